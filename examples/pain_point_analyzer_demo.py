@@ -0,0 +1,57 @@
+"""
+PainPointAnalyzer v3.0 demo.
+
+Shows how the same agent adapts its pain points to the client's business.
+
+Run from the repository root: python -m examples.pain_point_analyzer_demo
+"""
+
+from src.agents.v3.pain_point_analyzer_v3 import PainPointAnalyzerV3, PainPointAnalyzerInputSchema
+from src.models.client_context import ClientContext
+
+
+if __name__ == "__main__":
+    # Test with lead gen client
+    print("=== Test 1: Lead Gen Client (Kaleads) ===")
+
+    context = ClientContext(
+        client_id="kaleads-uuid",
+        client_name="Kaleads",
+        offerings=["lead generation B2B"],
+        pain_solved="génération de leads B2B qualifiés via l'automatisation"
+    )
+
+    agent = PainPointAnalyzerV3(client_context=context)
+
+    result = agent.run(PainPointAnalyzerInputSchema(
+        company_name="Aircall",
+        website="https://aircall.io",
+        industry="SaaS",
+        target_persona="VP Sales"
+    ))
+
+    print(f"Pain type: {result.pain_type}")
+    print(f"Problem: {result.problem_specific}")
+    print(f"Impact: {result.impact_measurable}")
+    print()
+
+    # Test with HR client
+    print("=== Test 2: HR Client (TalentHub) ===")
+    context_hr = ClientContext(
+        client_id="talenthub-uuid",
+        client_name="TalentHub",
+        offerings=["recrutement"],
+        pain_solved="recrutement et gestion RH efficace"
+    )
+
+    agent_hr = PainPointAnalyzerV3(client_context=context_hr)
+
+    result_hr = agent_hr.run(PainPointAnalyzerInputSchema(
+        company_name="TechCorp",
+        website="https://techcorp.example",
+        industry="Tech"
+    ))
+
+    print(f"Pain type: {result_hr.pain_type}")
+    print(f"Problem: {result_hr.problem_specific}")
+    print(f"Impact: {result_hr.impact_measurable}")
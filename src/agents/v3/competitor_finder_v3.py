@@ -10,9 +10,12 @@ Key improvements in v3:
 - Generic and reusable across clients
 """
 
-from typing import Optional
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import List, Optional, Sequence, Union
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 try:
     from src.models.client_context import ClientContext
@@ -24,18 +27,29 @@ try:
 except ImportError:
     get_tavily_client = None
 
+logger = logging.getLogger(__name__)
+
 
 class CompetitorFinderInputSchema(BaseModel):
     """Input schema for Competitor Finder."""
+    model_config = ConfigDict(frozen=True)
+
     company_name: str = Field(..., description="Name of the prospect company")
     website: str = Field(..., description="Website URL")
     industry: str = Field(default="", description="Industry/sector")
     product_category: str = Field(default="", description="Product category from PersonaExtractor")
     website_content: str = Field(default="", description="Scraped content (optional)")
 
+    @cached_property
+    def website_content_lc(self) -> str:
+        """Lowercased website_content, computed once per input (pages can be large)."""
+        return self.website_content.lower()
+
 
 class CompetitorFinderOutputSchema(BaseModel):
     """Output schema for Competitor Finder."""
+    model_config = ConfigDict(frozen=True)
+
     competitor_name: str = Field(..., description="Name of competitor/tool")
     competitor_product_category: str = Field(..., description="Category of competitor product")
     confidence_score: int = Field(..., description="Confidence score 1-5 (5=found on site, 1=guess)")
@@ -44,6 +58,10 @@ class CompetitorFinderOutputSchema(BaseModel):
     source: str = Field(default="inference", description="Source: 'web_search', 'site_scrape', 'inference'")
 
 
+# Built once at import: validates a whole batch of raw prospect dicts in one call
+CompetitorFinderInputBatchAdapter = TypeAdapter(List[CompetitorFinderInputSchema])
+
+
 class CompetitorFinderV3:
     """
     v3.0 Competitor Finder Agent.
@@ -93,13 +111,25 @@ class CompetitorFinderV3:
         self.enable_tavily = enable_tavily
         self.client_context = client_context
 
+        # Lowercased client/competitor names, used to filter every suggestion
+        self._client_name_lc = ""
+        self._competitors_lc = frozenset()
+        if client_context:
+            self._client_name_lc = client_context.client_name.lower()
+            self._competitors_lc = frozenset(c.lower() for c in client_context.competitors)
+
+        # LLM extractor for competitor mentions in scraped content (not wired yet)
+        self._scrape_extractor = None
+        if enable_scraping:
+            logger.debug("Competitor extraction from scraped content is disabled (no extractor wired)")
+
         # Initialize Tavily client
         self.tavily = None
         if enable_tavily and get_tavily_client:
             try:
                 self.tavily = get_tavily_client()
             except Exception as e:
-                print(f"Warning: Could not initialize Tavily: {e}")
+                logger.warning("Could not initialize Tavily: %s", e)
 
     def run(self, input_data: CompetitorFinderInputSchema) -> CompetitorFinderOutputSchema:
         """
@@ -137,6 +167,49 @@ class CompetitorFinderV3:
         # Strategy 4: Generic fallback
         return self._generic_fallback(input_data)
 
+    def run_batch(
+        self,
+        inputs: Sequence[Union[CompetitorFinderInputSchema, dict]],
+        max_concurrency: int = 8
+    ) -> List[CompetitorFinderOutputSchema]:
+        """
+        Find competitors for a batch of prospects.
+
+        Same strategies as run(), but applied stage by stage across the whole
+        batch: all Tavily searches are fanned out first (network-bound, run
+        concurrently), then the CPU-only strategies run over the remaining
+        prospects, and the generic fallback fills whatever is left.
+
+        Args:
+            inputs: Prospects (schemas or raw dicts, validated in one pass)
+            max_concurrency: Maximum number of concurrent Tavily searches
+
+        Returns:
+            List of CompetitorFinderOutputSchema, in the same order as inputs
+        """
+        prospects = CompetitorFinderInputBatchAdapter.validate_python(list(inputs))
+        results: List[Optional[CompetitorFinderOutputSchema]] = [None] * len(prospects)
+
+        # Stage 1: Tavily web search, fanned out across the batch
+        if prospects and self.tavily and self.tavily.enabled:
+            workers = max(1, min(max_concurrency, len(prospects)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(self._try_tavily_search, prospects))
+
+        # Stage 2-4: CPU-only strategies on the remaining prospects
+        for i, input_data in enumerate(prospects):
+            if results[i]:
+                continue
+
+            result = None
+            if self.enable_scraping and input_data.website_content:
+                result = self._try_scrape_competitor(input_data)
+            if not result:
+                result = self._try_industry_inference(input_data)
+            results[i] = result or self._generic_fallback(input_data)
+
+        return results
+
     def _try_tavily_search(self, input_data: CompetitorFinderInputSchema) -> Optional[CompetitorFinderOutputSchema]:
         """
         Try to find competitors using Tavily web search.
@@ -146,8 +219,12 @@ class CompetitorFinderV3:
         Returns:
             CompetitorFinderOutputSchema if found, None otherwise
         """
+        # Provider is down: skip straight to the cheaper strategies
+        if self.tavily.circuit_open:
+            return None
+
         try:
-            print(f"[CompetitorFinderV3] Using Tavily to find competitors for {input_data.company_name}")
+            logger.debug("Using Tavily to find competitors for %s", input_data.company_name)
 
             # Search for competitors
             competitors = self.tavily.search_competitors(
@@ -156,19 +233,15 @@ class CompetitorFinderV3:
             )
 
             if not competitors or competitors[0].startswith("Unknown"):
-                print(f"[CompetitorFinderV3] Tavily found no competitors")
+                logger.debug("Tavily found no competitors for %s", input_data.company_name)
                 return None
 
             # Filter out our client if in results
             if self.client_context:
-                competitors = [
-                    c for c in competitors
-                    if self.client_context.client_name.lower() not in c.lower()
-                    and c.lower() not in [comp.lower() for comp in self.client_context.competitors]
-                ]
+                competitors = [c for c in competitors if not self._is_excluded(c)]
 
             if not competitors:
-                print(f"[CompetitorFinderV3] All competitors filtered out (were client or client's competitors)")
+                logger.debug("All competitors filtered out (were client or client's competitors)")
                 return None
 
             # Take first competitor
@@ -184,7 +257,7 @@ class CompetitorFinderV3:
             )
 
         except Exception as e:
-            print(f"[CompetitorFinderV3] Tavily search failed: {e}")
+            logger.warning("Tavily search failed for %s: %s", input_data.company_name, e)
             return None
 
     def _try_scrape_competitor(self, input_data: CompetitorFinderInputSchema) -> Optional[CompetitorFinderOutputSchema]:
@@ -199,8 +272,12 @@ class CompetitorFinderV3:
         Returns:
             CompetitorFinderOutputSchema if found, None otherwise
         """
+        # Without an extractor the scan below can never produce a result
+        if not self._scrape_extractor:
+            return None
+
         # Simplified extraction - in real implementation, use LLM to extract
-        content = input_data.website_content.lower()
+        content = input_data.website_content_lc
 
         # Common patterns
         patterns = [
@@ -278,9 +355,7 @@ class CompetitorFinderV3:
             if (key1 in industry_lower or key1 in category_lower) and \
                (key2 in industry_lower or key2 in category_lower):
                 # Filter out client
-                if self.client_context and \
-                   (self.client_context.client_name.lower() in competitor.lower() or \
-                    competitor.lower() in [c.lower() for c in self.client_context.competitors]):
+                if self.client_context and self._is_excluded(competitor):
                     continue
 
                 return CompetitorFinderOutputSchema(
@@ -294,6 +369,11 @@ class CompetitorFinderV3:
 
         return None
 
+    def _is_excluded(self, competitor: str) -> bool:
+        """Check whether a suggestion is the client itself or one of the client's competitors."""
+        competitor_lc = competitor.lower()
+        return self._client_name_lc in competitor_lc or competitor_lc in self._competitors_lc
+
     def _generic_fallback(self, input_data: CompetitorFinderInputSchema) -> CompetitorFinderOutputSchema:
         """
         Generic fallback when no competitor found.
@@ -17,19 +17,64 @@ Example:
     → Agent will look for HR/RECRUITMENT pain points
 """
 
-from typing import Optional, Literal
-from pydantic import BaseModel, Field
+import asyncio
+import logging
+import re
+import sys
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, List, Literal, NamedTuple, Optional, Sequence, Set, Tuple, Union
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 try:
     from src.models.client_context import ClientContext
 except ImportError:
     ClientContext = None
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+from src.utils.hyperscan_db import compile_keyword_db
+
+logger = logging.getLogger(__name__)
+
 
 # ============================================
 # Pain Type Classification
 # ============================================
 
+# Keywords per pain type, in priority order (first matching type wins)
+PAIN_TYPE_KEYWORDS = (
+    # Client acquisition (lead gen, sales, prospecting)
+    ("client_acquisition", ("lead", "prospect", "client", "sales", "pipeline", "commercial", "vente", "acquisition")),
+    # HR/Recruitment
+    ("hr_recruitment", ("rh", "recruit", "talent", "embauche", "hiring", "onboarding", "turnover")),
+    # Tech/Infrastructure
+    ("tech_infrastructure", ("devops", "cloud", "infrastructure", "deploy", "ci/cd", "tech", "scalable")),
+    # Marketing
+    ("marketing", ("marketing", "martech", "automation marketing", "génération de demande", "demand gen")),
+    # Ops/Efficiency
+    ("ops_efficiency", ("ops", "efficiency", "efficacité", "process", "automation", "workflow", "productivité")),
+)
+
+
+# One expression per pain type, with the pain type's index as match id
+# (None without hyperscan: pure-Python scan is used)
+_PAIN_TYPE_DB = compile_keyword_db(
+    "pain type",
+    ["|".join(re.escape(kw) for kw in keywords) for _, keywords in PAIN_TYPE_KEYWORDS],
+)
+
+
+def _scan_pain_type_db(pain_lower: str) -> Optional[str]:
+    """Return the highest-priority pain type matched by the Hyperscan database."""
+    matched_ids = _PAIN_TYPE_DB.scan(pain_lower)
+    return PAIN_TYPE_KEYWORDS[min(matched_ids)][0] if matched_ids else None
+
+
+@lru_cache(maxsize=512)
 def classify_pain_type(pain_solved: str) -> Literal["client_acquisition", "hr_recruitment", "tech_infrastructure", "ops_efficiency", "marketing", "generic"]:
     """
     Classify the type of pain point based on what the client solves.
@@ -45,34 +90,23 @@ def classify_pain_type(pain_solved: str) -> Literal["client_acquisition", "hr_re
         "client_acquisition"
         >>> classify_pain_type("recrutement et gestion RH efficace")
         "hr_recruitment"
+
+    Results are memoized: agents built per prospect re-classify the same
+    client pain_solved string over and over.
     """
     pain_lower = pain_solved.lower()
 
-    # Client acquisition (lead gen, sales, prospecting)
-    if any(kw in pain_lower for kw in ["lead", "prospect", "client", "sales", "pipeline", "commercial", "vente", "acquisition"]):
-        return "client_acquisition"
+    if _PAIN_TYPE_DB is not None:
+        return _scan_pain_type_db(pain_lower) or "generic"
 
-    # HR/Recruitment
-    elif any(kw in pain_lower for kw in ["rh", "recruit", "talent", "embauche", "hiring", "onboarding", "turnover"]):
-        return "hr_recruitment"
+    for pain_type, keywords in PAIN_TYPE_KEYWORDS:
+        if any(kw in pain_lower for kw in keywords):
+            return pain_type
 
-    # Tech/Infrastructure
-    elif any(kw in pain_lower for kw in ["devops", "cloud", "infrastructure", "deploy", "ci/cd", "tech", "scalable"]):
-        return "tech_infrastructure"
-
-    # Marketing
-    elif any(kw in pain_lower for kw in ["marketing", "martech", "automation marketing", "génération de demande", "demand gen"]):
-        return "marketing"
-
-    # Ops/Efficiency
-    elif any(kw in pain_lower for kw in ["ops", "efficiency", "efficacité", "process", "automation", "workflow", "productivité"]):
-        return "ops_efficiency"
-
-    else:
-        return "generic"
+    return "generic"
 
 
-# Pain type instructions
+# Pain type instructions (kept terse: this text ends up in LLM prompts)
 PAIN_TYPE_INSTRUCTIONS = {
     "client_acquisition": {
         "focus": "CLIENT ACQUISITION, LEAD GENERATION, SALES GROWTH, PROSPECTING",
@@ -83,11 +117,11 @@ PAIN_TYPE_INSTRUCTIONS = {
             "✅ 'pipeline commercial insuffisant pour atteindre les objectifs'",
         ],
         "bad_examples": [
-            "❌ 'processus RH inefficaces' (NOT related to client acquisition)",
-            "❌ 'infrastructure technique obsolète' (NOT related to sales)",
-            "❌ 'manque de candidats qualifiés' (THIS IS HR, NOT CLIENT ACQUISITION)",
+            "❌ 'processus RH inefficaces' (not sales)",
+            "❌ 'infrastructure technique obsolète' (not sales)",
+            "❌ 'manque de candidats qualifiés' (HR, not sales)",
         ],
-        "context": "The prospect needs MORE CLIENTS/LEADS for their business. Focus on their ability to GET NEW CUSTOMERS."
+        "context": "Prospect needs more clients/leads. Focus: winning new customers."
     },
     "hr_recruitment": {
         "focus": "HR, RECRUITMENT, TALENT MANAGEMENT, ONBOARDING, RETENTION",
@@ -98,11 +132,11 @@ PAIN_TYPE_INSTRUCTIONS = {
             "✅ 'onboarding manuel qui consomme beaucoup de ressources'",
         ],
         "bad_examples": [
-            "❌ 'difficulté à acquérir des clients' (NOT related to HR)",
-            "❌ 'infrastructure cloud non scalable' (NOT related to HR)",
-            "❌ 'prospection manuelle inefficace' (THIS IS SALES, NOT HR)",
+            "❌ 'difficulté à acquérir des clients' (not HR)",
+            "❌ 'infrastructure cloud non scalable' (not HR)",
+            "❌ 'prospection manuelle inefficace' (sales, not HR)",
         ],
-        "context": "The prospect struggles with HIRING, MANAGING, or RETAINING employees. Focus on HR/talent challenges."
+        "context": "Prospect struggles to hire, manage or retain employees. Focus: HR/talent."
     },
     "tech_infrastructure": {
         "focus": "TECH INFRASTRUCTURE, DEVOPS, SCALABILITY, DEPLOYMENT, CI/CD",
@@ -113,11 +147,11 @@ PAIN_TYPE_INSTRUCTIONS = {
             "✅ 'infrastructure cloud coûteuse et mal optimisée'",
         ],
         "bad_examples": [
-            "❌ 'difficulté à recruter des développeurs' (THIS IS HR, NOT infrastructure)",
-            "❌ 'manque de prospects qualifiés' (THIS IS SALES, NOT tech)",
-            "❌ 'processus RH manuels' (NOT related to infrastructure)",
+            "❌ 'difficulté à recruter des développeurs' (HR, not infra)",
+            "❌ 'manque de prospects qualifiés' (sales, not infra)",
+            "❌ 'processus RH manuels' (not infra)",
         ],
-        "context": "The prospect has TECHNICAL/INFRASTRUCTURE challenges. Focus on deployment, scalability, DevOps."
+        "context": "Prospect has tech/infrastructure issues. Focus: deployment, scalability, DevOps."
     },
     "marketing": {
         "focus": "MARKETING AUTOMATION, DEMAND GENERATION, CAMPAIGN MANAGEMENT, LEAD NURTURING",
@@ -128,10 +162,10 @@ PAIN_TYPE_INSTRUCTIONS = {
             "✅ 'pas d'automatisation des campagnes email'",
         ],
         "bad_examples": [
-            "❌ 'prospection commerciale manuelle' (THIS IS SALES, NOT marketing)",
-            "❌ 'processus RH inefficaces' (NOT related to marketing)",
+            "❌ 'prospection commerciale manuelle' (sales, not marketing)",
+            "❌ 'processus RH inefficaces' (not marketing)",
         ],
-        "context": "The prospect struggles with MARKETING automation, campaign management, or demand generation."
+        "context": "Prospect struggles with marketing automation, campaigns or demand gen. Focus: marketing."
     },
     "ops_efficiency": {
         "focus": "OPERATIONAL EFFICIENCY, PROCESS AUTOMATION, WORKFLOW OPTIMIZATION, PRODUCTIVITY",
@@ -142,10 +176,10 @@ PAIN_TYPE_INSTRUCTIONS = {
             "✅ 'données dispersées dans plusieurs outils'",
         ],
         "bad_examples": [
-            "❌ 'difficulté à acquérir des clients' (THIS IS SALES, NOT ops efficiency)",
-            "❌ 'processus de recrutement long' (THIS IS HR, NOT ops)",
+            "❌ 'difficulté à acquérir des clients' (sales, not ops)",
+            "❌ 'processus de recrutement long' (HR, not ops)",
         ],
-        "context": "The prospect has OPERATIONAL/PROCESS inefficiencies. Focus on automation, productivity, workflow."
+        "context": "Prospect has process inefficiencies. Focus: automation, productivity, workflow."
     },
     "generic": {
         "focus": "BUSINESS CHALLENGES, GROWTH, EFFICIENCY, COMPETITIVENESS",
@@ -155,10 +189,242 @@ PAIN_TYPE_INSTRUCTIONS = {
             "✅ 'manque d'automatisation des processus métier'",
         ],
         "bad_examples": [],
-        "context": "The prospect has general business challenges. Use broad, applicable pain points."
+        "context": "Prospect has general business challenges. Use broad pain points."
     },
 }
 
+# Freeze instructions: shared read-only across agents and worker processes
+PAIN_TYPE_INSTRUCTIONS = MappingProxyType({
+    sys.intern(pain_type): MappingProxyType({
+        **instructions,
+        "good_examples": tuple(instructions["good_examples"]),
+        "bad_examples": tuple(instructions["bad_examples"]),
+    })
+    for pain_type, instructions in PAIN_TYPE_INSTRUCTIONS.items()
+})
+
+
+# ============================================
+# Industry Pain Mappings
+# ============================================
+
+class PainCopy(NamedTuple):
+    """Pain copy used in emails (shared, immutable singletons)."""
+    problem: str
+    impact: str
+
+
+# Industry keyword -> bucket (substring match, so "consult" also covers "consulting")
+INDUSTRY_BUCKETS: Dict[str, str] = {
+    "saas": "software",
+    "software": "software",
+    "tech": "tech",
+    "b2b": "b2b",
+    "consult": "consulting",
+    "agency": "consulting",
+    "agence": "consulting",
+    "service": "services",
+    "health": "health",
+    "santé": "health",
+    "commerce": "commerce",
+    "retail": "commerce",
+    "fin": "finance",
+    "bank": "finance",
+    "finance": "finance",
+}
+
+# Buckets checked for each pain type, in priority order (first matching bucket wins)
+PAIN_BUCKET_PRIORITY: Dict[str, Tuple[str, ...]] = {
+    "client_acquisition": ("software", "tech", "consulting", "services"),
+    "hr_recruitment": ("software", "tech", "health", "commerce"),
+    "tech_infrastructure": ("software", "tech", "commerce", "finance"),
+    "marketing": ("software", "b2b", "commerce"),
+    "ops_efficiency": (),
+    "generic": (),
+}
+
+SAAS_CLIENT_ACQ = PainCopy(
+    "difficulté à générer suffisamment de leads qualifiés pour alimenter le pipeline commercial",
+    "croissance ralentie et objectifs de vente non atteints"
+)
+TECH_HR = PainCopy(
+    "processus de recrutement long qui prend plusieurs semaines par poste tech",
+    "ralentissement du développement produit et perte de candidats qualifiés"
+)
+SAAS_TECH = PainCopy(
+    "déploiements manuels qui prennent du temps et génèrent des incidents",
+    "time-to-market ralenti et expérience utilisateur dégradée"
+)
+SAAS_MARKETING = PainCopy(
+    "campagnes marketing manuelles qui prennent beaucoup de temps à créer",
+    "faible volume de leads et ROI marketing difficile à mesurer"
+)
+
+# Generic pain per pain type: used when no industry bucket matches, and as fallback
+GENERIC_CLIENT_ACQ = PainCopy(
+    "difficulté à acquérir de nouveaux clients de manière régulière et prévisible",
+    "croissance incertaine et dépendance à quelques gros clients"
+)
+GENERIC_HR = PainCopy(
+    "processus de recrutement manuel qui consomme beaucoup de ressources RH",
+    "time-to-hire élevé et difficulté à scaler l'équipe"
+)
+GENERIC_TECH = PainCopy(
+    "infrastructure technique non optimisée qui ralentit les opérations",
+    "coûts d'infrastructure élevés et agilité limitée"
+)
+GENERIC_MARKETING = PainCopy(
+    "pas d'automatisation des campagnes marketing et du lead nurturing",
+    "opportunités commerciales perdues et équipe marketing surchargée"
+)
+GENERIC_OPS = PainCopy(
+    "processus manuels et répétitifs qui consomment beaucoup de temps",
+    "productivité limitée et erreurs fréquentes dans les opérations"
+)
+GENERIC_BUSINESS = PainCopy(
+    "processus métier inefficaces qui limitent la croissance",
+    "difficulté à scaler les opérations et compétitivité réduite"
+)
+
+# (pain_type, bucket) -> pain; the "generic" bucket applies when no bucket matches
+PAIN_TABLE: Dict[Tuple[str, str], PainCopy] = {
+    # Client acquisition
+    ("client_acquisition", "software"): SAAS_CLIENT_ACQ,
+    ("client_acquisition", "tech"): SAAS_CLIENT_ACQ,
+    ("client_acquisition", "consulting"): PainCopy(
+        "prospection manuelle qui consomme trop de temps et génère peu de résultats",
+        "équipe commerciale surchargée et manque de nouveaux clients"
+    ),
+    ("client_acquisition", "services"): PainCopy(
+        "taux de conversion faible des prospects en clients",
+        "coût d'acquisition client élevé et rentabilité limitée"
+    ),
+    ("client_acquisition", "generic"): GENERIC_CLIENT_ACQ,
+
+    # HR/Recruitment
+    ("hr_recruitment", "software"): TECH_HR,
+    ("hr_recruitment", "tech"): TECH_HR,
+    ("hr_recruitment", "health"): PainCopy(
+        "difficulté à attirer et retenir des professionnels de santé qualifiés",
+        "taux de turnover élevé et coûts de recrutement importants"
+    ),
+    ("hr_recruitment", "commerce"): PainCopy(
+        "turnover élevé qui nécessite des recrutements fréquents",
+        "coûts de formation récurrents et qualité de service variable"
+    ),
+    ("hr_recruitment", "generic"): GENERIC_HR,
+
+    # Tech/Infrastructure
+    ("tech_infrastructure", "software"): SAAS_TECH,
+    ("tech_infrastructure", "tech"): SAAS_TECH,
+    ("tech_infrastructure", "commerce"): PainCopy(
+        "infrastructure non scalable lors des pics de trafic",
+        "pertes de revenus lors des promotions et expérience client médiocre"
+    ),
+    ("tech_infrastructure", "finance"): PainCopy(
+        "infrastructure legacy qui limite l'innovation et la rapidité",
+        "difficulté à lancer de nouveaux produits et perte de compétitivité"
+    ),
+    ("tech_infrastructure", "generic"): GENERIC_TECH,
+
+    # Marketing
+    ("marketing", "software"): SAAS_MARKETING,
+    ("marketing", "b2b"): SAAS_MARKETING,
+    ("marketing", "commerce"): PainCopy(
+        "personnalisation limitée des campagnes marketing",
+        "taux de conversion faible et coût d'acquisition client élevé"
+    ),
+    ("marketing", "generic"): GENERIC_MARKETING,
+
+    # Ops/Efficiency
+    ("ops_efficiency", "generic"): GENERIC_OPS,
+
+    # Generic
+    ("generic", "generic"): GENERIC_BUSINESS,
+}
+
+
+def _build_industry_automaton():
+    """
+    Build an Aho-Corasick automaton over all INDUSTRY_BUCKETS keywords.
+
+    Returns None if pyahocorasick is not installed (substring scan is used).
+    """
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for keyword, bucket in INDUSTRY_BUCKETS.items():
+        automaton.add_word(keyword, bucket)
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_bucket_patterns() -> Dict[str, "re.Pattern"]:
+    """Compile one keyword alternation per bucket (e.g. 'fin|bank|finance')."""
+    keywords_by_bucket: Dict[str, List[str]] = {}
+    for keyword, bucket in INDUSTRY_BUCKETS.items():
+        keywords_by_bucket.setdefault(bucket, []).append(re.escape(keyword))
+    return {
+        bucket: re.compile("|".join(keywords), re.IGNORECASE)
+        for bucket, keywords in keywords_by_bucket.items()
+    }
+
+
+_INDUSTRY_AUTOMATON = _build_industry_automaton()
+_BUCKET_PATTERNS = _build_bucket_patterns()
+
+
+def match_industry_buckets(industry_lower: str) -> Set[str]:
+    """Return every industry bucket whose keywords appear in the (lowercased) industry."""
+    if _INDUSTRY_AUTOMATON is not None:
+        return {bucket for _, bucket in _INDUSTRY_AUTOMATON.iter(industry_lower)}
+
+    return {bucket for bucket, pattern in _BUCKET_PATTERNS.items() if pattern.search(industry_lower)}
+
+
+def lookup_industry_pain(pain_type: str, industry_lower: str) -> PainCopy:
+    """
+    Look up the pain for a pain type and a (lowercased) industry.
+
+    The industry is scanned once for all buckets, then the pain type's buckets
+    are checked in priority order.
+
+    Example:
+        >>> lookup_industry_pain("tech_infrastructure", "fintech").problem
+        "déploiements manuels qui prennent du temps et génèrent des incidents"
+    """
+    priority = PAIN_BUCKET_PRIORITY.get(pain_type, ())
+    if priority:
+        matched = match_industry_buckets(industry_lower)
+        for bucket in priority:
+            if bucket in matched:
+                return PAIN_TABLE[(pain_type, bucket)]
+    return PAIN_TABLE.get((pain_type, "generic"), PAIN_TABLE[("generic", "generic")])
+
+
+# Generic fallback pain per pain type (same copy as the "generic" industry bucket)
+_FALLBACK_PAINS: Dict[str, PainCopy] = {
+    "client_acquisition": GENERIC_CLIENT_ACQ,
+    "hr_recruitment": GENERIC_HR,
+    "tech_infrastructure": GENERIC_TECH,
+    "marketing": GENERIC_MARKETING,
+    "ops_efficiency": GENERIC_OPS,
+    "generic": GENERIC_BUSINESS,
+}
+
+
+@lru_cache(maxsize=4096)
+def _infer_pain_core(pain_type: str, industry: str) -> PainCopy:
+    """
+    Memoized PainCopy (problem, impact) for a pain type and (lowercased) industry.
+
+    The persona does not change the copy, so it is not part of the key. Lead
+    lists repeat the same industries a lot, so most prospects resolve to a
+    single cache probe.
+    """
+    return lookup_industry_pain(pain_type, industry)
+
 
 # ============================================
 # Schemas
@@ -166,6 +432,10 @@ PAIN_TYPE_INSTRUCTIONS = {
 
 class PainPointAnalyzerInputSchema(BaseModel):
     """Input schema for Pain Point Analyzer."""
+    # Frozen: hashable and safe to share (Pydantic has no slots option; the
+    # cached *_lower properties also need the instance __dict__)
+    model_config = ConfigDict(frozen=True)
+
     company_name: str = Field(..., description="Name of the prospect company")
     website: str = Field(..., description="Website URL")
     industry: str = Field(default="", description="Industry/sector")
@@ -173,9 +443,22 @@ class PainPointAnalyzerInputSchema(BaseModel):
     product_category: str = Field(default="", description="Product category from PersonaExtractor")
     website_content: str = Field(default="", description="Scraped content (optional)")
 
+    @cached_property
+    def industry_lower(self) -> str:
+        """Lowercased industry, computed once per input."""
+        return (self.industry or "").lower()
+
+    @cached_property
+    def persona_lower(self) -> str:
+        """Lowercased target persona, computed once per input."""
+        return (self.target_persona or "").lower()
+
 
 class PainPointAnalyzerOutputSchema(BaseModel):
     """Output schema for Pain Point Analyzer."""
+    # Frozen: outputs are cached and shared across prospects
+    model_config = ConfigDict(frozen=True)
+
     problem_specific: str = Field(..., description="Specific pain point (lowercase fragment, no ending punctuation)")
     impact_measurable: str = Field(..., description="Measurable impact of the pain point")
     confidence_score: int = Field(..., description="Confidence score 1-5 (5=found on site, 1=inferred)")
@@ -184,6 +467,19 @@ class PainPointAnalyzerOutputSchema(BaseModel):
     pain_type: str = Field(..., description="Type of pain detected (client_acquisition, hr_recruitment, etc.)")
 
 
+# Built once at import: validates a whole batch of raw prospect dicts in one call
+PainPointAnalyzerInputBatchAdapter = TypeAdapter(List[PainPointAnalyzerInputSchema])
+
+@lru_cache(maxsize=1024)
+def _inferred_reasoning(industry: str, pain_type: str) -> str:
+    """Reasoning string for an inferred pain (formatted once per industry/pain type)."""
+    return f"Inferred from industry '{industry}' and pain type '{pain_type}'"
+
+
+# One shared (frozen) fallback output per pain type, built on first use
+_FALLBACK_CACHE: Dict[str, PainPointAnalyzerOutputSchema] = {}
+
+
 # ============================================
 # Agent
 # ============================================
@@ -229,8 +525,36 @@ class PainPointAnalyzerV3:
         "processus de recrutement manuel qui prend plusieurs semaines"
         >>> print(result_hr.pain_type)
         "hr_recruitment"
+
+        >>> # Batch pipelines: reuse one shared instance per client pain type
+        >>> agent = PainPointAnalyzerV3.get(client_context=context)
     """
 
+    @classmethod
+    def get(
+        cls,
+        *,
+        api_key: Optional[str] = None,
+        model: Optional[str] = None,
+        enable_scraping: bool = True,
+        enable_tavily: bool = True,
+        client_context: Optional["ClientContext"] = None
+    ) -> "PainPointAnalyzerV3":
+        """
+        Get a shared analyzer instead of building one per prospect.
+
+        run() only depends on the pain type classified from
+        client_context.pain_solved (plus the constructor flags), so all
+        callers whose pain_solved maps to the same pain type share one
+        instance. Shared instances carry no client_context.
+
+        Returns:
+            PainPointAnalyzerV3 instance
+        """
+        pain_solved = client_context.pain_solved if client_context else None
+        pain_type = classify_pain_type(pain_solved) if pain_solved else "generic"
+        return _shared_pain_analyzer(pain_type, api_key, model, enable_scraping, enable_tavily)
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -255,15 +579,33 @@ class PainPointAnalyzerV3:
         self.enable_tavily = enable_tavily  # Not used by PainPointAnalyzer, but kept for consistency
         self.client_context = client_context
 
+        # Scraped-content analysis (LLM): input -> Optional[output]. None until
+        # an implementation is wired in, so run() skips the scrape strategy
+        self._scrape_impl: Optional[Callable[[PainPointAnalyzerInputSchema], Optional[PainPointAnalyzerOutputSchema]]] = None
+
         # Determine pain type from client context
         if client_context and client_context.pain_solved:
-            self.pain_type = classify_pain_type(client_context.pain_solved)
-            self.instructions = PAIN_TYPE_INSTRUCTIONS[self.pain_type]
+            self._set_pain_type(classify_pain_type(client_context.pain_solved))
         else:
-            self.pain_type = "generic"
-            self.instructions = PAIN_TYPE_INSTRUCTIONS["generic"]
-
-        print(f"[PainPointAnalyzerV3] Initialized with pain_type: {self.pain_type}")
+            self._set_pain_type("generic")
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("PainPointAnalyzerV3 initialized pain_type=%s", self.pain_type)
+
+    def _set_pain_type(self, pain_type: str) -> None:
+        """Set the pain type and resolve its instructions and inference helper."""
+        self.pain_type = pain_type
+        self.instructions = PAIN_TYPE_INSTRUCTIONS[pain_type]
+
+        # Resolve the pain inference helper once instead of branching per run()
+        self._pain_dispatch = {
+            "client_acquisition": self._infer_client_acquisition_pain,
+            "hr_recruitment": self._infer_hr_pain,
+            "tech_infrastructure": self._infer_tech_pain,
+            "marketing": self._infer_marketing_pain,
+            "ops_efficiency": self._infer_ops_pain,
+        }
+        self._infer_fn = self._pain_dispatch.get(pain_type, self._infer_generic_pain)
 
     def run(self, input_data: PainPointAnalyzerInputSchema) -> PainPointAnalyzerOutputSchema:
         """
@@ -281,8 +623,8 @@ class PainPointAnalyzerV3:
             PainPointAnalyzerOutputSchema with pain point info
         """
         # Strategy 1: Try scraping (if content provided)
-        if self.enable_scraping and input_data.website_content:
-            result = self._try_scrape_pain(input_data)
+        if self.enable_scraping and self._scrape_impl is not None and input_data.website_content:
+            result = self._scrape_impl(input_data)
             if result:
                 return result
 
@@ -294,18 +636,114 @@ class PainPointAnalyzerV3:
         # Strategy 3: Generic fallback
         return self._generic_fallback(input_data)
 
-    def _try_scrape_pain(self, input_data: PainPointAnalyzerInputSchema) -> Optional[PainPointAnalyzerOutputSchema]:
+    def run_batch(
+        self,
+        inputs: Sequence[Union[PainPointAnalyzerInputSchema, dict]]
+    ) -> List[PainPointAnalyzerOutputSchema]:
+        """
+        Identify pain points for a batch of prospects.
+
+        Same strategies as run(), with the per-agent state (inference helper,
+        pain type, reasoning formatter) resolved once for the whole batch.
+
+        Args:
+            inputs: Prospects (schemas or raw dicts, validated in one pass)
+
+        Returns:
+            List of PainPointAnalyzerOutputSchema, in the same order as inputs
+        """
+        prospects = PainPointAnalyzerInputBatchAdapter.validate_python(list(inputs))
+
+        infer = self._infer_fn
+        pain_type = self.pain_type
+        scrape = self._scrape_impl if self.enable_scraping else None
+        construct = PainPointAnalyzerOutputSchema.model_construct
+
+        results = []
+        for input_data in prospects:
+            # Strategy 1: Try scraping (if content provided)
+            if scrape is not None and input_data.website_content:
+                result = scrape(input_data)
+                if result:
+                    results.append(result)
+                    continue
+
+            # Strategy 2: Infer from industry + persona + pain type
+            problem, impact = infer(input_data.industry_lower, input_data.persona_lower)
+            results.append(construct(
+                problem_specific=problem,
+                impact_measurable=impact,
+                confidence_score=3,
+                fallback_level=1,
+                reasoning=_inferred_reasoning(input_data.industry, pain_type),
+                pain_type=pain_type
+            ))
+
+        return results
+
+    async def arun(self, input_data: PainPointAnalyzerInputSchema) -> PainPointAnalyzerOutputSchema:
+        """
+        Async version of run().
+
+        The scrape strategy is awaited, so many prospects can have their
+        (network-bound) website analysis in flight at once.
+
+        Args:
+            input_data: Prospect information
+
+        Returns:
+            PainPointAnalyzerOutputSchema with pain point info
+        """
+        # Strategy 1: Try scraping (if content provided)
+        if self.enable_scraping and self._scrape_impl is not None and input_data.website_content:
+            result = await self._atry_scrape_pain(input_data)
+            if result:
+                return result
+
+        # Strategy 2: Infer from industry + persona + pain type (CPU only)
+        result = self._infer_pain(input_data)
+        if result:
+            return result
+
+        # Strategy 3: Generic fallback
+        return self._generic_fallback(input_data)
+
+    async def arun_batch(
+        self,
+        inputs: Sequence[Union[PainPointAnalyzerInputSchema, dict]],
+        max_concurrency: int = 20
+    ) -> List[PainPointAnalyzerOutputSchema]:
+        """
+        Identify pain points for a batch of prospects concurrently.
+
+        Args:
+            inputs: Prospects (schemas or raw dicts, validated in one pass)
+            max_concurrency: Maximum number of prospects analyzed at once
+
+        Returns:
+            List of PainPointAnalyzerOutputSchema, in the same order as inputs
+        """
+        prospects = PainPointAnalyzerInputBatchAdapter.validate_python(list(inputs))
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(input_data: PainPointAnalyzerInputSchema) -> PainPointAnalyzerOutputSchema:
+            async with semaphore:
+                return await self.arun(input_data)
+
+        return list(await asyncio.gather(*(run_one(p) for p in prospects)))
+
+    async def _atry_scrape_pain(self, input_data: PainPointAnalyzerInputSchema) -> Optional[PainPointAnalyzerOutputSchema]:
         """
-        Try to extract pain point from scraped website content.
+        Try to extract pain point from scraped website content (async).
 
-        This would require LLM analysis of the content.
-        Placeholder for now.
+        Runs the wired (blocking, LLM-backed) implementation in a worker
+        thread, so the event loop stays free and arun_batch() keeps up to
+        max_concurrency analyses in flight.
 
         Returns:
             PainPointAnalyzerOutputSchema if found, None otherwise
         """
-        # Placeholder - would use LLM to extract pain from website
-        return None
+        return await asyncio.to_thread(self._scrape_impl, input_data)
 
     def _infer_pain(self, input_data: PainPointAnalyzerInputSchema) -> PainPointAnalyzerOutputSchema:
         """
@@ -316,147 +754,41 @@ class PainPointAnalyzerV3:
         Returns:
             PainPointAnalyzerOutputSchema with inferred pain
         """
-        industry_lower = (input_data.industry or "").lower()
-        persona_lower = (input_data.target_persona or "").lower()
-
-        # Pain mappings by type
-        if self.pain_type == "client_acquisition":
-            pain = self._infer_client_acquisition_pain(industry_lower, persona_lower)
-        elif self.pain_type == "hr_recruitment":
-            pain = self._infer_hr_pain(industry_lower, persona_lower)
-        elif self.pain_type == "tech_infrastructure":
-            pain = self._infer_tech_pain(industry_lower, persona_lower)
-        elif self.pain_type == "marketing":
-            pain = self._infer_marketing_pain(industry_lower, persona_lower)
-        elif self.pain_type == "ops_efficiency":
-            pain = self._infer_ops_pain(industry_lower, persona_lower)
-        else:
-            pain = self._infer_generic_pain(industry_lower)
+        problem, impact = self._infer_fn(input_data.industry_lower, input_data.persona_lower)
 
-        return PainPointAnalyzerOutputSchema(
-            problem_specific=pain["problem"],
-            impact_measurable=pain["impact"],
+        # Values come from the curated pain tables: skip Pydantic validation
+        return PainPointAnalyzerOutputSchema.model_construct(
+            problem_specific=problem,
+            impact_measurable=impact,
             confidence_score=3,
             fallback_level=1,
-            reasoning=f"Inferred from industry '{input_data.industry}' and pain type '{self.pain_type}'",
+            reasoning=_inferred_reasoning(input_data.industry, self.pain_type),
             pain_type=self.pain_type
         )
 
-    def _infer_client_acquisition_pain(self, industry: str, persona: str) -> dict:
+    def _infer_client_acquisition_pain(self, industry: str, persona: str) -> PainCopy:
         """Infer CLIENT ACQUISITION pain points."""
-        # SaaS/Tech
-        if "saas" in industry or "software" in industry or "tech" in industry:
-            return {
-                "problem": "difficulté à générer suffisamment de leads qualifiés pour alimenter le pipeline commercial",
-                "impact": "croissance ralentie et objectifs de vente non atteints"
-            }
-        # Consulting/Agencies
-        elif "consult" in industry or "agency" in industry or "agence" in industry:
-            return {
-                "problem": "prospection manuelle qui consomme trop de temps et génère peu de résultats",
-                "impact": "équipe commerciale surchargée et manque de nouveaux clients"
-            }
-        # Services
-        elif "service" in industry:
-            return {
-                "problem": "taux de conversion faible des prospects en clients",
-                "impact": "coût d'acquisition client élevé et rentabilité limitée"
-            }
-        # Generic
-        else:
-            return {
-                "problem": "difficulté à acquérir de nouveaux clients de manière régulière et prévisible",
-                "impact": "croissance incertaine et dépendance à quelques gros clients"
-            }
+        return _infer_pain_core("client_acquisition", industry)
 
-    def _infer_hr_pain(self, industry: str, persona: str) -> dict:
+    def _infer_hr_pain(self, industry: str, persona: str) -> PainCopy:
         """Infer HR/RECRUITMENT pain points."""
-        # Tech
-        if "tech" in industry or "software" in industry or "saas" in industry:
-            return {
-                "problem": "processus de recrutement long qui prend plusieurs semaines par poste tech",
-                "impact": "ralentissement du développement produit et perte de candidats qualifiés"
-            }
-        # Healthcare
-        elif "health" in industry or "santé" in industry:
-            return {
-                "problem": "difficulté à attirer et retenir des professionnels de santé qualifiés",
-                "impact": "taux de turnover élevé et coûts de recrutement importants"
-            }
-        # Retail
-        elif "retail" in industry or "commerce" in industry:
-            return {
-                "problem": "turnover élevé qui nécessite des recrutements fréquents",
-                "impact": "coûts de formation récurrents et qualité de service variable"
-            }
-        # Generic
-        else:
-            return {
-                "problem": "processus de recrutement manuel qui consomme beaucoup de ressources RH",
-                "impact": "time-to-hire élevé et difficulté à scaler l'équipe"
-            }
+        return _infer_pain_core("hr_recruitment", industry)
 
-    def _infer_tech_pain(self, industry: str, persona: str) -> dict:
+    def _infer_tech_pain(self, industry: str, persona: str) -> PainCopy:
         """Infer TECH/INFRASTRUCTURE pain points."""
-        # SaaS/Tech
-        if "saas" in industry or "tech" in industry or "software" in industry:
-            return {
-                "problem": "déploiements manuels qui prennent du temps et génèrent des incidents",
-                "impact": "time-to-market ralenti et expérience utilisateur dégradée"
-            }
-        # E-commerce
-        elif "commerce" in industry or "retail" in industry:
-            return {
-                "problem": "infrastructure non scalable lors des pics de trafic",
-                "impact": "pertes de revenus lors des promotions et expérience client médiocre"
-            }
-        # FinTech
-        elif "fin" in industry or "bank" in industry or "finance" in industry:
-            return {
-                "problem": "infrastructure legacy qui limite l'innovation et la rapidité",
-                "impact": "difficulté à lancer de nouveaux produits et perte de compétitivité"
-            }
-        # Generic
-        else:
-            return {
-                "problem": "infrastructure technique non optimisée qui ralentit les opérations",
-                "impact": "coûts d'infrastructure élevés et agilité limitée"
-            }
+        return _infer_pain_core("tech_infrastructure", industry)
 
-    def _infer_marketing_pain(self, industry: str, persona: str) -> dict:
+    def _infer_marketing_pain(self, industry: str, persona: str) -> PainCopy:
         """Infer MARKETING pain points."""
-        # SaaS/B2B
-        if "saas" in industry or "b2b" in industry or "software" in industry:
-            return {
-                "problem": "campagnes marketing manuelles qui prennent beaucoup de temps à créer",
-                "impact": "faible volume de leads et ROI marketing difficile à mesurer"
-            }
-        # E-commerce
-        elif "commerce" in industry or "retail" in industry:
-            return {
-                "problem": "personnalisation limitée des campagnes marketing",
-                "impact": "taux de conversion faible et coût d'acquisition client élevé"
-            }
-        # Generic
-        else:
-            return {
-                "problem": "pas d'automatisation des campagnes marketing et du lead nurturing",
-                "impact": "opportunités commerciales perdues et équipe marketing surchargée"
-            }
+        return _infer_pain_core("marketing", industry)
 
-    def _infer_ops_pain(self, industry: str, persona: str) -> dict:
+    def _infer_ops_pain(self, industry: str, persona: str) -> PainCopy:
         """Infer OPERATIONAL EFFICIENCY pain points."""
-        return {
-            "problem": "processus manuels et répétitifs qui consomment beaucoup de temps",
-            "impact": "productivité limitée et erreurs fréquentes dans les opérations"
-        }
+        return _infer_pain_core("ops_efficiency", industry)
 
-    def _infer_generic_pain(self, industry: str) -> dict:
+    def _infer_generic_pain(self, industry: str, persona: str = "") -> PainCopy:
         """Infer GENERIC pain points."""
-        return {
-            "problem": "processus métier inefficaces qui limitent la croissance",
-            "impact": "difficulté à scaler les opérations et compétitivité réduite"
-        }
+        return _infer_pain_core("generic", industry)
 
     def _generic_fallback(self, input_data: PainPointAnalyzerInputSchema) -> PainPointAnalyzerOutputSchema:
         """
@@ -467,87 +799,41 @@ class PainPointAnalyzerV3:
         Returns:
             PainPointAnalyzerOutputSchema with generic fallback
         """
-        fallback_pains = {
-            "client_acquisition": {
-                "problem": "difficulté à acquérir de nouveaux clients de manière prévisible",
-                "impact": "croissance limitée et objectifs commerciaux difficiles à atteindre"
-            },
-            "hr_recruitment": {
-                "problem": "processus de recrutement qui prend du temps et des ressources",
-                "impact": "difficulté à trouver et retenir les bons talents"
-            },
-            "tech_infrastructure": {
-                "problem": "infrastructure technique qui limite l'agilité et l'innovation",
-                "impact": "coûts élevés et difficulté à s'adapter rapidement au marché"
-            },
-            "marketing": {
-                "problem": "campagnes marketing manuelles et difficiles à mesurer",
-                "impact": "ROI marketing incertain et génération de leads limitée"
-            },
-            "ops_efficiency": {
-                "problem": "processus opérationnels manuels et peu efficaces",
-                "impact": "productivité limitée et coûts opérationnels élevés"
-            },
-            "generic": {
-                "problem": "processus métier inefficaces qui freinent la croissance",
-                "impact": "difficulté à scaler et compétitivité réduite"
-            }
-        }
-
-        pain = fallback_pains.get(self.pain_type, fallback_pains["generic"])
-
-        return PainPointAnalyzerOutputSchema(
-            problem_specific=pain["problem"],
-            impact_measurable=pain["impact"],
-            confidence_score=1,
-            fallback_level=3,
-            reasoning=f"Generic fallback for pain type '{self.pain_type}'",
-            pain_type=self.pain_type
-        )
-
-
-# Example usage
-if __name__ == "__main__":
-    # Test with lead gen client
-    print("=== Test 1: Lead Gen Client (Kaleads) ===")
-    from src.models.client_context import ClientContext
-
-    context = ClientContext(
-        client_id="kaleads-uuid",
-        client_name="Kaleads",
-        offerings=["lead generation B2B"],
-        pain_solved="génération de leads B2B qualifiés via l'automatisation"
+        fallback = _FALLBACK_CACHE.get(self.pain_type)
+        if fallback is None:
+            pain = _FALLBACK_PAINS.get(self.pain_type, _FALLBACK_PAINS["generic"])
+            fallback = PainPointAnalyzerOutputSchema.model_construct(
+                problem_specific=pain.problem,
+                impact_measurable=pain.impact,
+                confidence_score=1,
+                fallback_level=3,
+                reasoning=f"Generic fallback for pain type '{self.pain_type}'",
+                pain_type=self.pain_type
+            )
+            _FALLBACK_CACHE[self.pain_type] = fallback
+
+        return fallback
+
+
+# Shared analyzers for PainPointAnalyzerV3.get(): a handful of pain types x
+# constructor settings per process, bounded in case callers vary api_key/model
+SHARED_ANALYZERS_MAX_SIZE = 64
+
+
+@lru_cache(maxsize=SHARED_ANALYZERS_MAX_SIZE)
+def _shared_pain_analyzer(
+    pain_type: str,
+    api_key: Optional[str],
+    model: Optional[str],
+    enable_scraping: bool,
+    enable_tavily: bool
+) -> PainPointAnalyzerV3:
+    """Build the shared analyzer for a pain type and constructor settings (once)."""
+    analyzer = PainPointAnalyzerV3(
+        api_key=api_key,
+        model=model,
+        enable_scraping=enable_scraping,
+        enable_tavily=enable_tavily
     )
-
-    agent = PainPointAnalyzerV3(client_context=context)
-
-    result = agent.run(PainPointAnalyzerInputSchema(
-        company_name="Aircall",
-        industry="SaaS",
-        target_persona="VP Sales"
-    ))
-
-    print(f"Pain type: {result.pain_type}")
-    print(f"Problem: {result.problem_specific}")
-    print(f"Impact: {result.impact_measurable}")
-    print()
-
-    # Test with HR client
-    print("=== Test 2: HR Client (TalentHub) ===")
-    context_hr = ClientContext(
-        client_id="talenthub-uuid",
-        client_name="TalentHub",
-        offerings=["recrutement"],
-        pain_solved="recrutement et gestion RH efficace"
-    )
-
-    agent_hr = PainPointAnalyzerV3(client_context=context_hr)
-
-    result_hr = agent_hr.run(PainPointAnalyzerInputSchema(
-        company_name="TechCorp",
-        industry="Tech"
-    ))
-
-    print(f"Pain type: {result_hr.pain_type}")
-    print(f"Problem: {result_hr.problem_specific}")
-    print(f"Impact: {result_hr.impact_measurable}")
+    analyzer._set_pain_type(pain_type)
+    return analyzer
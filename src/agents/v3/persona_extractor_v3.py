@@ -10,9 +10,26 @@ Key improvements in v3:
 - Generic and reusable across clients
 """
 
-from typing import Optional, List
+import asyncio
+import logging
+import re
+from typing import Any, Dict, Optional, List, Sequence, Tuple, Union
+from dataclasses import asdict, dataclass
 from datetime import datetime
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from pydantic import BaseModel, Field, TypeAdapter
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+logger = logging.getLogger(__name__)
 
 try:
     from src.models.client_context import ClientContext
@@ -20,9 +37,194 @@ except ImportError:
     ClientContext = None
 
 try:
-    from src.providers.tavily_client import get_tavily_client
+    from src.providers.tavily_client import create_tavily_session, get_tavily_client
 except ImportError:
     get_tavily_client = None
+    create_tavily_session = None
+
+from src.utils.hyperscan_db import compile_keyword_db
+
+
+# Client pain → persona bucket, in priority order (first bucket that matches wins)
+PERSONA_BUCKET_KEYWORDS = (
+    # Client acquisition (lead gen, sales)
+    ("sales", ("lead", "prospect", "sales", "client acquisition")),
+    # Marketing
+    ("marketing", ("marketing", "demand", "campaign", "content")),
+    # HR / Recruitment
+    ("hr", ("rh", "recruit", "talent", "hiring")),
+    # DevOps / Infrastructure
+    ("eng", ("devops", "cloud", "infrastructure", "deployment")),
+    # Ops / Process
+    ("ops", ("ops", "process", "workflow", "automation")),
+)
+
+# One anchored pattern, one lookahead branch per bucket: alternation is tried
+# in priority order, and match.lastgroup names the first bucket that matched
+# anywhere in the string (a plain alternation would return the leftmost keyword).
+# Matched against already-lowercased text (ClientContext.pain_solved_lower);
+# used when hyperscan is not installed.
+_PAIN_RE = re.compile(
+    "^(?:" + "|".join(
+        "(?=.*?(?:{}))(?P<{}>)".format("|".join(map(re.escape, keywords)), bucket)
+        for bucket, keywords in PERSONA_BUCKET_KEYWORDS
+    ) + ")",
+    re.DOTALL
+)
+
+# Pain points as shared tuples: outputs reference them, nothing is copied per call
+_PAIN_POINTS_NO_CONTEXT = ("Efficiency", "Growth")
+_PAIN_POINTS_GENERIC = ("Efficiency", "Growth", "Cost optimization")
+_PAIN_POINTS_SALES = (
+    "Difficulté à générer des leads qualifiés",
+    "Pipeline de ventes insuffisant",
+    "Prospection manuelle chronophage",
+    "Taux de conversion faible"
+)
+_PAIN_POINTS_MARKETING = (
+    "Difficulté à générer de la demande qualifiée",
+    "ROI marketing incertain",
+    "Campagnes non personnalisées",
+    "Attribution marketing complexe"
+)
+_PAIN_POINTS_HR = (
+    "Difficulté à recruter des talents qualifiés",
+    "Processus de recrutement lent",
+    "Turnover élevé",
+    "Expérience candidat médiocre"
+)
+_PAIN_POINTS_ENGINEERING = (
+    "Déploiements lents et risqués",
+    "Infrastructure non scalable",
+    "Coûts cloud élevés",
+    "Manque de visibilité sur la stack"
+)
+_PAIN_POINTS_OPERATIONS = (
+    "Processus manuels inefficaces",
+    "Manque de visibilité opérationnelle",
+    "Coordination inter-équipes difficile",
+    "Scalabilité limitée"
+)
+_PAIN_POINTS_EXECUTIVE = (
+    "Croissance revenue",
+    "Efficacité opérationnelle",
+    "Compétitivité marché"
+)
+
+_PERSONA_TEMPLATES = {
+    "sales": {
+        "role": "Head of Sales",
+        "department": "Sales",
+        "seniority_level": "VP / Director",
+        "likely_pain_points": _PAIN_POINTS_SALES,
+        "fallback_level": 1,
+        "reasoning": "Inferred from client pain: '{pain_solved}' → Sales persona",
+    },
+    "marketing": {
+        "role": "CMO",
+        "department": "Marketing",
+        "seniority_level": "C-level / VP",
+        "likely_pain_points": _PAIN_POINTS_MARKETING,
+        "fallback_level": 1,
+        "reasoning": "Inferred from client pain: '{pain_solved}' → Marketing persona",
+    },
+    "hr": {
+        "role": "CHRO",
+        "department": "Human Resources",
+        "seniority_level": "C-level / VP",
+        "likely_pain_points": _PAIN_POINTS_HR,
+        "fallback_level": 1,
+        "reasoning": "Inferred from client pain: '{pain_solved}' → HR persona",
+    },
+    "eng": {
+        "role": "CTO",
+        "department": "Engineering",
+        "seniority_level": "C-level / VP",
+        "likely_pain_points": _PAIN_POINTS_ENGINEERING,
+        "fallback_level": 1,
+        "reasoning": "Inferred from client pain: '{pain_solved}' → Engineering persona",
+    },
+    "ops": {
+        "role": "COO",
+        "department": "Operations",
+        "seniority_level": "C-level / VP",
+        "likely_pain_points": _PAIN_POINTS_OPERATIONS,
+        "fallback_level": 1,
+        "reasoning": "Inferred from client pain: '{pain_solved}' → Operations persona",
+    },
+    # Generic fallback
+    "default": {
+        "role": "CEO",
+        "department": "Executive",
+        "seniority_level": "C-level",
+        "likely_pain_points": _PAIN_POINTS_EXECUTIVE,
+        "fallback_level": 2,
+        "reasoning": "Generic inference from client pain: '{pain_solved}'",
+    },
+}
+
+_TARGET_ROLES = {bucket: template["role"] for bucket, template in _PERSONA_TEMPLATES.items()}
+
+
+# One expression per bucket, with the bucket's index as match id
+# (None without hyperscan: the regex is used)
+_PERSONA_BUCKET_DB = compile_keyword_db(
+    "persona bucket",
+    ["|".join(re.escape(kw) for kw in keywords) for _, keywords in PERSONA_BUCKET_KEYWORDS],
+)
+
+
+def _scan_persona_bucket_db(pain_lower: str) -> str:
+    """Return the highest-priority bucket matched by the Hyperscan database."""
+    matched_ids = _PERSONA_BUCKET_DB.scan(pain_lower)
+    return PERSONA_BUCKET_KEYWORDS[min(matched_ids)][0] if matched_ids else "default"
+
+
+# Common patterns for team pages
+TEAM_PAGE_PATTERNS = (
+    "our team",
+    "leadership",
+    "meet the team",
+    "about us",
+    "management team"
+)
+
+
+def _build_team_automaton():
+    """
+    Build an Aho-Corasick automaton over TEAM_PAGE_PATTERNS.
+
+    Returns None if pyahocorasick is not installed (regex scan is used).
+    """
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for pattern in TEAM_PAGE_PATTERNS:
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    return automaton
+
+
+_TEAM_AUTOMATON = _build_team_automaton()
+_TEAM_RE = re.compile("|".join(map(re.escape, TEAM_PAGE_PATTERNS)), re.IGNORECASE)
+
+
+def has_team_info(website_content: str) -> bool:
+    """True if the page mentions any team page pattern (single pass over the content)."""
+    if _TEAM_AUTOMATON is not None:
+        return next(_TEAM_AUTOMATON.iter(website_content.lower()), None) is not None
+
+    return _TEAM_RE.search(website_content) is not None
+
+
+def pain_bucket(pain_lower: str) -> str:
+    """Return the persona bucket for a lowercased pain_solved ("default" if none matches)."""
+    if _PERSONA_BUCKET_DB is not None:
+        return _scan_persona_bucket_db(pain_lower)
+
+    match = _PAIN_RE.match(pain_lower)
+    return match.lastgroup if match else "default"
 
 
 class PersonaExtractorInputSchema(BaseModel):
@@ -34,16 +236,73 @@ class PersonaExtractorInputSchema(BaseModel):
     website_content: str = Field(default="", description="Scraped website content (optional)")
 
 
-class PersonaExtractorOutputSchema(BaseModel):
-    """Output schema for Persona Extractor."""
-    role: str = Field(..., description="Decision-maker role (e.g., 'CMO', 'Head of Sales', 'CTO')")
-    department: str = Field(..., description="Department (e.g., 'Marketing', 'Sales', 'Engineering')")
-    seniority_level: str = Field(..., description="Seniority (e.g., 'C-level', 'VP', 'Director', 'Manager')")
-    likely_pain_points: List[str] = Field(default_factory=list, description="Likely pain points for this persona")
-    confidence_score: int = Field(..., description="Confidence score 1-5 (5=found on site, 1=inferred)")
-    fallback_level: int = Field(..., description="Fallback level 0-3 (0=best, 3=generic)")
-    reasoning: str = Field(..., description="Reasoning for the persona choice")
-    source: str = Field(default="inference", description="Source: 'web_search', 'site_scrape', 'inference'")
+# Built once at import: validates a whole batch of raw prospect dicts in one call
+PersonaExtractorInputBatchAdapter = TypeAdapter(List[PersonaExtractorInputSchema])
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PersonaExtractorOutputSchema:
+    """
+    Output schema for Persona Extractor.
+
+    A plain frozen dataclass rather than a Pydantic model: every field is
+    produced by the agent itself, so validation would be pure overhead.
+    Instances are cached and shared across prospects.
+    """
+    role: str  # Decision-maker role (e.g., 'CMO', 'Head of Sales', 'CTO')
+    department: str  # Department (e.g., 'Marketing', 'Sales', 'Engineering')
+    seniority_level: str  # Seniority (e.g., 'C-level', 'VP', 'Director', 'Manager')
+    likely_pain_points: Tuple[str, ...] = ()  # Likely pain points for this persona
+    confidence_score: int  # Confidence score 1-5 (5=found on site, 1=inferred)
+    fallback_level: int  # Fallback level 0-3 (0=best, 3=generic)
+    reasoning: str  # Reasoning for the persona choice
+    source: str = "inference"  # Source: 'web_search', 'site_scrape', 'inference'
+
+    def model_dump(self) -> Dict[str, Any]:
+        """Serialize to a dict (same call as the Pydantic schemas, for the API layer)."""
+        return asdict(self)
+
+@lru_cache(maxsize=512)
+def _cached_persona(pain_solved: Optional[str], confidence: int, source: str) -> PersonaExtractorOutputSchema:
+    """
+    Build (once) the persona for a client pain.
+
+    Keyed on the pain_solved string rather than the ClientContext object, so
+    every prospect of a client shares the same frozen output.
+
+    Args:
+        pain_solved: Client's pain_solved (None if no client context)
+        confidence: Confidence score (1-5)
+        source: Source of persona info
+
+    Returns:
+        PersonaExtractorOutputSchema
+    """
+    if pain_solved is None:
+        # No context - return generic
+        return PersonaExtractorOutputSchema(
+            role="Decision-maker",
+            department="General",
+            seniority_level="C-level",
+            likely_pain_points=_PAIN_POINTS_NO_CONTEXT,
+            confidence_score=confidence,
+            fallback_level=2,
+            reasoning="Inferred from industry without client context",
+            source=source
+        )
+
+    template = _PERSONA_TEMPLATES[pain_bucket(pain_solved.lower())]
+
+    return PersonaExtractorOutputSchema(
+        role=template["role"],
+        department=template["department"],
+        seniority_level=template["seniority_level"],
+        likely_pain_points=template["likely_pain_points"],
+        confidence_score=confidence,
+        fallback_level=template["fallback_level"],
+        reasoning=template["reasoning"].format(pain_solved=pain_solved),
+        source=source
+    )
 
 
 class PersonaExtractorV3:
@@ -71,6 +330,18 @@ class PersonaExtractorV3:
         "Sales"
     """
 
+    __slots__ = (
+        "api_key",
+        "model",
+        "enable_scraping",
+        "enable_tavily",
+        "client_context",
+        "tavily",
+        "_tavily_enabled",
+        "_local_strategies",
+        "_strategies",
+    )
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -101,7 +372,19 @@ class PersonaExtractorV3:
             try:
                 self.tavily = get_tavily_client()
             except Exception as e:
-                print(f"Warning: Could not initialize Tavily: {e}")
+                logger.warning("Could not initialize Tavily: %s", e)
+
+        # Active strategies, in order, resolved once (run() just iterates them)
+        self._tavily_enabled = bool(self.tavily and self.tavily.enabled)
+        self._local_strategies = tuple(
+            strategy for strategy, enabled in (
+                (self._try_scrape_persona, enable_scraping),
+                (self._try_context_inference, True),
+            ) if enabled
+        )
+        self._strategies = (
+            ((self._try_tavily_search,) if self._tavily_enabled else ()) + self._local_strategies
+        )
 
     def run(self, input_data: PersonaExtractorInputSchema) -> PersonaExtractorOutputSchema:
         """
@@ -119,26 +402,113 @@ class PersonaExtractorV3:
         Returns:
             PersonaExtractorOutputSchema with persona info
         """
-        # Strategy 1: Tavily web search (LinkedIn, team pages)
-        if self.tavily and self.tavily.enabled:
-            result = self._try_tavily_search(input_data)
+        for strategy in self._strategies:
+            result = strategy(input_data)
             if result:
                 return result
 
-        # Strategy 2: Scrape prospect's website (team/about pages)
-        if self.enable_scraping and input_data.website_content:
-            result = self._try_scrape_persona(input_data)
+        return self._generic_fallback(input_data)
+
+    async def run_async(
+        self,
+        input_data: PersonaExtractorInputSchema,
+        session: Optional["aiohttp.ClientSession"] = None
+    ) -> PersonaExtractorOutputSchema:
+        """
+        Async version of run().
+
+        The Tavily search is awaited instead of blocking the event loop; the
+        remaining strategies are CPU-only and run inline.
+
+        Args:
+            input_data: Prospect information
+            session: aiohttp session (defaults to the loop's shared Tavily session)
+
+        Returns:
+            PersonaExtractorOutputSchema with persona info
+        """
+        # Strategy 1: Tavily web search (LinkedIn, team pages)
+        if self._tavily_enabled:
+            result = await self._try_tavily_search_async(input_data, session)
             if result:
                 return result
 
-        # Strategy 3: Industry + Client context inference
-        result = self._try_context_inference(input_data)
-        if result:
-            return result
+        # Remaining strategies are CPU-only
+        for strategy in self._local_strategies:
+            result = strategy(input_data)
+            if result:
+                return result
 
-        # Strategy 4: Generic fallback
         return self._generic_fallback(input_data)
 
+    def run_batch(
+        self,
+        inputs: Sequence[Union[PersonaExtractorInputSchema, dict]],
+        max_concurrency: int = 20
+    ) -> List[PersonaExtractorOutputSchema]:
+        """
+        Extract personas for a batch of prospects.
+
+        With Tavily enabled, all searches are issued concurrently (wall time is
+        the slowest search, not the sum). Otherwise every prospect takes the
+        sync scrape/inference path, with no event loop involved.
+
+        Must not be called from a running event loop: use arun_batch() there.
+
+        Args:
+            inputs: Prospects (schemas or raw dicts, validated in one pass)
+            max_concurrency: Maximum number of concurrent Tavily searches
+
+        Returns:
+            List of PersonaExtractorOutputSchema, in the same order as inputs
+        """
+        prospects = PersonaExtractorInputBatchAdapter.validate_python(list(inputs))
+
+        if not self._tavily_enabled:
+            return [self.run(input_data) for input_data in prospects]
+
+        async def run_and_close():
+            # asyncio.run() closes its loop on return: use a private session
+            # for this batch and release its connections here
+            session = create_tavily_session() if aiohttp is not None else None
+            try:
+                return await self.arun_batch(prospects, max_concurrency, session=session)
+            finally:
+                if session is not None:
+                    await session.close()
+
+        return asyncio.run(run_and_close())
+
+    async def arun_batch(
+        self,
+        inputs: Sequence[Union[PersonaExtractorInputSchema, dict]],
+        max_concurrency: int = 20,
+        session: Optional["aiohttp.ClientSession"] = None
+    ) -> List[PersonaExtractorOutputSchema]:
+        """
+        Extract personas for a batch of prospects concurrently.
+
+        All Tavily searches go through one keep-alive session (by default the
+        loop's shared one); max_concurrency bounds the number of requests in
+        flight (Tavily rate limit).
+
+        Args:
+            inputs: Prospects (schemas or raw dicts, validated in one pass)
+            max_concurrency: Maximum number of concurrent Tavily searches
+            session: aiohttp session (defaults to the loop's shared Tavily session)
+
+        Returns:
+            List of PersonaExtractorOutputSchema, in the same order as inputs
+        """
+        prospects = PersonaExtractorInputBatchAdapter.validate_python(list(inputs))
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(input_data):
+            async with semaphore:
+                return await self.run_async(input_data, session)
+
+        return list(await asyncio.gather(*(run_one(x) for x in prospects)))
+
     def _try_tavily_search(self, input_data: PersonaExtractorInputSchema) -> Optional[PersonaExtractorOutputSchema]:
         """
         Try to find decision-maker using Tavily web search.
@@ -152,7 +522,7 @@ class PersonaExtractorV3:
             PersonaExtractorOutputSchema if found, None otherwise
         """
         try:
-            print(f"[PersonaExtractorV3] Using Tavily to find decision-maker for {input_data.company_name}")
+            logger.debug("Using Tavily to find decision-maker for %s", input_data.company_name)
 
             # Determine target role based on client context
             target_role = self._determine_target_role_from_context()
@@ -160,19 +530,47 @@ class PersonaExtractorV3:
             # Search for decision-maker
             query = f"{input_data.company_name} {target_role} LinkedIn"
             results = self.tavily.search(query, max_results=3)
+            return self._persona_from_search(input_data, results)
 
-            if not results or "results" not in results:
-                print(f"[PersonaExtractorV3] Tavily found no results")
-                return None
+        except Exception as e:
+            logger.warning("Tavily search failed for %s: %s", input_data.company_name, e)
+            return None
 
-            # Extract persona from results (simplified - real impl would use LLM)
-            # For now, return inferred persona based on context
-            return self._build_persona_from_context(input_data, confidence=4, source="web_search")
+    async def _try_tavily_search_async(
+        self,
+        input_data: PersonaExtractorInputSchema,
+        session: Optional["aiohttp.ClientSession"] = None
+    ) -> Optional[PersonaExtractorOutputSchema]:
+        """
+        Async version of _try_tavily_search() (TavilyClient.asearch).
 
-        except Exception as e:
-            print(f"[PersonaExtractorV3] Tavily search failed: {e}")
+        Returns:
+            PersonaExtractorOutputSchema if found, None otherwise
+        """
+        logger.debug("Using Tavily to find decision-maker for %s", input_data.company_name)
+
+        # Determine target role based on client context
+        target_role = self._determine_target_role_from_context()
+
+        # Search for decision-maker
+        query = f"{input_data.company_name} {target_role} LinkedIn"
+        results = await self.tavily.asearch(query, max_results=3, session=session)
+        return self._persona_from_search(input_data, results)
+
+    def _persona_from_search(
+        self,
+        input_data: PersonaExtractorInputSchema,
+        results: Optional[Dict[str, Any]]
+    ) -> Optional[PersonaExtractorOutputSchema]:
+        """Persona from Tavily search results, or None if nothing was found (or the search failed)."""
+        if not results or not results.get("results"):
+            logger.debug("Tavily found no results for %s", input_data.company_name)
             return None
 
+        # Extract persona from results (simplified - real impl would use LLM)
+        # For now, return inferred persona based on context
+        return self._build_persona_from_context(input_data, confidence=4, source="web_search")
+
     def _try_scrape_persona(self, input_data: PersonaExtractorInputSchema) -> Optional[PersonaExtractorOutputSchema]:
         """
         Try to extract persona from scraped website content.
@@ -185,21 +583,8 @@ class PersonaExtractorV3:
         Returns:
             PersonaExtractorOutputSchema if found, None otherwise
         """
-        content = input_data.website_content.lower()
-
-        # Common patterns for team pages
-        team_patterns = [
-            "our team",
-            "leadership",
-            "meet the team",
-            "about us",
-            "management team"
-        ]
-
         # Check if website has team info
-        has_team_info = any(pattern in content for pattern in team_patterns)
-
-        if has_team_info:
+        if input_data.website_content and has_team_info(input_data.website_content):
             # Found team page - in real implementation, use LLM to extract
             # For now, return inferred persona with medium confidence
             return self._build_persona_from_context(input_data, confidence=3, source="site_scrape")
@@ -230,7 +615,7 @@ class PersonaExtractorV3:
             role="Decision-maker",
             department="General",
             seniority_level="C-level / VP",
-            likely_pain_points=["Efficiency", "Growth", "Cost optimization"],
+            likely_pain_points=_PAIN_POINTS_GENERIC,
             confidence_score=1,
             fallback_level=3,
             reasoning="No specific persona found, using generic decision-maker",
@@ -247,21 +632,7 @@ class PersonaExtractorV3:
         if not self.client_context:
             return "CEO"
 
-        pain_lower = self.client_context.pain_solved.lower()
-
-        # Map pain solved to target role
-        if any(kw in pain_lower for kw in ["lead", "prospect", "sales", "client acquisition"]):
-            return "Head of Sales"
-        elif any(kw in pain_lower for kw in ["marketing", "demand", "campaign"]):
-            return "CMO"
-        elif any(kw in pain_lower for kw in ["rh", "recruit", "talent", "hiring"]):
-            return "CHRO"
-        elif any(kw in pain_lower for kw in ["devops", "cloud", "infrastructure", "deployment"]):
-            return "CTO"
-        elif any(kw in pain_lower for kw in ["ops", "process", "workflow", "automation"]):
-            return "COO"
-        else:
-            return "CEO"
+        return _TARGET_ROLES[pain_bucket(self.client_context.pain_solved_lower)]
 
     def _build_persona_from_context(
         self,
@@ -272,6 +643,9 @@ class PersonaExtractorV3:
         """
         Build persona output based on client context.
 
+        Outputs are cached per (pain_solved, confidence, source); the
+        returned schema is frozen and shared.
+
         Args:
             input_data: Prospect information
             confidence: Confidence score (1-5)
@@ -280,127 +654,8 @@ class PersonaExtractorV3:
         Returns:
             PersonaExtractorOutputSchema
         """
-        if not self.client_context:
-            # No context - return generic
-            return PersonaExtractorOutputSchema(
-                role="Decision-maker",
-                department="General",
-                seniority_level="C-level",
-                likely_pain_points=["Efficiency", "Growth"],
-                confidence_score=confidence,
-                fallback_level=2,
-                reasoning="Inferred from industry without client context",
-                source=source
-            )
-
-        pain_lower = self.client_context.pain_solved.lower()
-
-        # CLIENT ACQUISITION (lead gen, sales)
-        if any(kw in pain_lower for kw in ["lead", "prospect", "sales", "client acquisition"]):
-            return PersonaExtractorOutputSchema(
-                role="Head of Sales",
-                department="Sales",
-                seniority_level="VP / Director",
-                likely_pain_points=[
-                    "Difficulté à générer des leads qualifiés",
-                    "Pipeline de ventes insuffisant",
-                    "Prospection manuelle chronophage",
-                    "Taux de conversion faible"
-                ],
-                confidence_score=confidence,
-                fallback_level=1,
-                reasoning=f"Inferred from client pain: '{self.client_context.pain_solved}' → Sales persona",
-                source=source
-            )
-
-        # MARKETING
-        elif any(kw in pain_lower for kw in ["marketing", "demand", "campaign", "content"]):
-            return PersonaExtractorOutputSchema(
-                role="CMO",
-                department="Marketing",
-                seniority_level="C-level / VP",
-                likely_pain_points=[
-                    "Difficulté à générer de la demande qualifiée",
-                    "ROI marketing incertain",
-                    "Campagnes non personnalisées",
-                    "Attribution marketing complexe"
-                ],
-                confidence_score=confidence,
-                fallback_level=1,
-                reasoning=f"Inferred from client pain: '{self.client_context.pain_solved}' → Marketing persona",
-                source=source
-            )
-
-        # HR / RECRUITMENT
-        elif any(kw in pain_lower for kw in ["rh", "recruit", "talent", "hiring"]):
-            return PersonaExtractorOutputSchema(
-                role="CHRO",
-                department="Human Resources",
-                seniority_level="C-level / VP",
-                likely_pain_points=[
-                    "Difficulté à recruter des talents qualifiés",
-                    "Processus de recrutement lent",
-                    "Turnover élevé",
-                    "Expérience candidat médiocre"
-                ],
-                confidence_score=confidence,
-                fallback_level=1,
-                reasoning=f"Inferred from client pain: '{self.client_context.pain_solved}' → HR persona",
-                source=source
-            )
-
-        # DEVOPS / INFRASTRUCTURE
-        elif any(kw in pain_lower for kw in ["devops", "cloud", "infrastructure", "deployment"]):
-            return PersonaExtractorOutputSchema(
-                role="CTO",
-                department="Engineering",
-                seniority_level="C-level / VP",
-                likely_pain_points=[
-                    "Déploiements lents et risqués",
-                    "Infrastructure non scalable",
-                    "Coûts cloud élevés",
-                    "Manque de visibilité sur la stack"
-                ],
-                confidence_score=confidence,
-                fallback_level=1,
-                reasoning=f"Inferred from client pain: '{self.client_context.pain_solved}' → Engineering persona",
-                source=source
-            )
-
-        # OPS / PROCESS
-        elif any(kw in pain_lower for kw in ["ops", "process", "workflow", "automation"]):
-            return PersonaExtractorOutputSchema(
-                role="COO",
-                department="Operations",
-                seniority_level="C-level / VP",
-                likely_pain_points=[
-                    "Processus manuels inefficaces",
-                    "Manque de visibilité opérationnelle",
-                    "Coordination inter-équipes difficile",
-                    "Scalabilité limitée"
-                ],
-                confidence_score=confidence,
-                fallback_level=1,
-                reasoning=f"Inferred from client pain: '{self.client_context.pain_solved}' → Operations persona",
-                source=source
-            )
-
-        # GENERIC FALLBACK
-        else:
-            return PersonaExtractorOutputSchema(
-                role="CEO",
-                department="Executive",
-                seniority_level="C-level",
-                likely_pain_points=[
-                    "Croissance revenue",
-                    "Efficacité opérationnelle",
-                    "Compétitivité marché"
-                ],
-                confidence_score=confidence,
-                fallback_level=2,
-                reasoning=f"Generic inference from client pain: '{self.client_context.pain_solved}'",
-                source=source
-            )
+        pain_solved = self.client_context.pain_solved if self.client_context else None
+        return _cached_persona(pain_solved, confidence, source)
 
 
 # Example usage
@@ -16,6 +16,9 @@ IMPORTANT: This agent was previously called CaseStudyAgent and had confusing dua
 Now it's clear what it does in each mode.
 """
 
+import logging
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional, Literal
 from pydantic import BaseModel, Field
 
@@ -25,6 +28,8 @@ except ImportError:
     ClientContext = None
     CaseStudy = None
 
+logger = logging.getLogger(__name__)
+
 
 # ============================================
 # Schemas
@@ -51,6 +56,49 @@ class ProofGeneratorOutputSchema(BaseModel):
     case_study_industry: Optional[str] = Field(None, description="Industry from case study (if real)")
 
 
+# ============================================
+# Generic fallback (no fake companies!)
+# ============================================
+
+# Generic statements by industry (keys lowercase; insertion order = partial-match order)
+GENERIC_RESULTS = MappingProxyType({
+    "saas": "des entreprises SaaS similaires à optimiser significativement leur génération de leads",
+    "tech": "des entreprises tech à améliorer leur efficacité commerciale",
+    "consulting": "des cabinets de conseil à développer leur pipeline client",
+    "agency": "des agences à augmenter leur nombre de clients réguliers",
+    "finance": "des institutions financières à moderniser leur prospection",
+    "healthcare": "des entreprises du secteur santé à optimiser leurs processus d'acquisition",
+    "retail": "des entreprises du retail à améliorer leur performance commerciale",
+    "default": "des entreprises similaires à optimiser leur génération de prospects"
+})
+_GENERIC_DEFAULT = GENERIC_RESULTS["default"]
+_GENERIC_ITEMS = tuple(GENERIC_RESULTS.items())
+
+
+@lru_cache(maxsize=512)
+def _generic_result(industry_lower: str) -> str:
+    """
+    Find the generic statement for an industry: exact match, then partial match, then default.
+
+    Memoized: prospect industries repeat heavily across a batch.
+    """
+    return GENERIC_RESULTS.get(industry_lower) or next(
+        (value for key, value in _GENERIC_ITEMS if key in industry_lower or industry_lower in key),
+        _GENERIC_DEFAULT
+    )
+
+
+@lru_cache(maxsize=512)
+def _format_adapted(industry: str, case_study_result: str) -> str:
+    """
+    Adapt a client case study result to a prospect's industry.
+
+    Memoized: the adapted case study is the same for a whole batch and
+    prospect industries repeat heavily.
+    """
+    return f"une entreprise {industry or 'similaire'} à {case_study_result}"
+
+
 # ============================================
 # Agent
 # ============================================
@@ -129,11 +177,12 @@ class ProofGeneratorV3:
         self.client_context = client_context
         self.mode = mode
 
-        print(f"[ProofGeneratorV3] Initialized with mode: {mode}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ProofGeneratorV3 initialized mode=%s", mode)
 
         # Validate: client_case_studies mode requires client_context
         if mode == "client_case_studies" and not client_context:
-            print("[ProofGeneratorV3] WARNING: client_case_studies mode without ClientContext - will fallback to generic")
+            logger.warning("client_case_studies mode without ClientContext - will fallback to generic")
 
     def run(self, input_data: ProofGeneratorInputSchema) -> ProofGeneratorOutputSchema:
         """
@@ -170,12 +219,13 @@ class ProofGeneratorV3:
             # No case studies available - use generic fallback
             return self._generic_fallback(input_data)
 
-        # Strategy 1: Find perfect match by industry
-        case_study = self.client_context.find_case_study_by_industry(input_data.industry)
+        # Strategy 1: Find perfect match by industry (none possible without one)
+        industry = input_data.industry
+        case_study = self.client_context.find_case_study_by_industry(industry) if industry else None
 
         if case_study:
-            # Perfect match!
-            return ProofGeneratorOutputSchema(
+            # Perfect match! (fields come from a validated CaseStudy: skip Pydantic validation)
+            return ProofGeneratorOutputSchema.model_construct(
                 case_study_result=case_study.to_short_string(),
                 confidence_score=5,
                 fallback_level=0,
@@ -189,9 +239,9 @@ class ProofGeneratorV3:
         first_cs = self.client_context.real_case_studies[0]
 
         # Adapt the case study
-        adapted_result = f"une entreprise {input_data.industry or 'similaire'} à {first_cs.result}"
+        adapted_result = _format_adapted(input_data.industry or "", first_cs.result)
 
-        return ProofGeneratorOutputSchema(
+        return ProofGeneratorOutputSchema.model_construct(
             case_study_result=adapted_result,
             confidence_score=4,
             fallback_level=1,
@@ -217,7 +267,7 @@ class ProofGeneratorV3:
                 return result
 
         # Fallback: Generic mention
-        return ProofGeneratorOutputSchema(
+        return ProofGeneratorOutputSchema.model_construct(
             case_study_result=f"aidé de nombreux clients dans le secteur {input_data.industry or 'B2B'} à atteindre leurs objectifs",
             confidence_score=2,
             fallback_level=2,
@@ -256,34 +306,9 @@ class ProofGeneratorV3:
         """
         # Generic based on industry
         industry = input_data.industry or "B2B"
+        result = _generic_result(industry.lower())
 
-        # Generic statements (no fake companies!)
-        generic_results = {
-            "saas": "des entreprises SaaS similaires à optimiser significativement leur génération de leads",
-            "tech": "des entreprises tech à améliorer leur efficacité commerciale",
-            "consulting": "des cabinets de conseil à développer leur pipeline client",
-            "agency": "des agences à augmenter leur nombre de clients réguliers",
-            "finance": "des institutions financières à moderniser leur prospection",
-            "healthcare": "des entreprises du secteur santé à optimiser leurs processus d'acquisition",
-            "retail": "des entreprises du retail à améliorer leur performance commerciale",
-            "default": "des entreprises similaires à optimiser leur génération de prospects"
-        }
-
-        # Find matching generic
-        industry_lower = industry.lower()
-        result = generic_results.get(industry_lower)
-
-        if not result:
-            # Try partial match
-            for key, value in generic_results.items():
-                if key in industry_lower or industry_lower in key:
-                    result = value
-                    break
-
-        if not result:
-            result = generic_results["default"]
-
-        return ProofGeneratorOutputSchema(
+        return ProofGeneratorOutputSchema.model_construct(
             case_study_result=result,
             confidence_score=1,
             fallback_level=3,
@@ -10,9 +10,24 @@ Key improvements in v3:
 - Generic and reusable across clients
 """
 
-from typing import Optional, List, Literal
+import asyncio
+import logging
+import re
+from typing import Any, Dict, Iterable, Mapping, Optional, List, Literal, Sequence, Tuple, Union
 from datetime import datetime
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from types import MappingProxyType
+from pydantic import BaseModel, Field, TypeAdapter
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
 
 try:
     from src.models.client_context import ClientContext
@@ -24,6 +39,302 @@ try:
 except ImportError:
     get_tavily_client = None
 
+try:
+    from src.utils.ttl_cache import TTLCache
+except ImportError:
+    TTLCache = None
+
+from src.utils.hyperscan_db import compile_keyword_db
+
+logger = logging.getLogger(__name__)
+
+
+# Tavily news cache: the same company shows up across pipeline runs (retries,
+# multi-campaign targeting), so recent news is reused for NEWS_CACHE_TTL seconds
+NEWS_MONTHS = 3
+NEWS_CACHE_TTL = 3 * 3600
+NEWS_CACHE_MAX_SIZE = 10_000
+
+_NEWS_CACHE = TTLCache(maxsize=NEWS_CACHE_MAX_SIZE, ttl=NEWS_CACHE_TTL) if TTLCache else None
+
+
+def _news_cache_key(company_name: str, months: int = NEWS_MONTHS) -> Tuple[str, int]:
+    """Cache key for a company's news (case and surrounding whitespace ignored)."""
+    return company_name.strip().lower(), months
+
+
+def get_cached_news(key: Tuple[str, int]) -> Optional[List[Dict[str, Any]]]:
+    """
+    Return cached news for `key`, or None if missing or expired.
+
+    Updates the hit/miss counters (see news_cache_stats).
+    """
+    return _NEWS_CACHE.get(key) if _NEWS_CACHE is not None else None
+
+
+def cache_news(key: Tuple[str, int], news: List[Dict[str, Any]]) -> None:
+    """
+    Store news for `key`.
+
+    Empty results are not cached: the Tavily client returns [] on errors too,
+    and a failed search must not hide a company's news for the whole TTL.
+    """
+    if news and _NEWS_CACHE is not None:
+        _NEWS_CACHE.set(key, news)
+
+
+def news_cache_stats() -> Dict[str, Any]:
+    """Return news cache counters: hits, misses, size and hit_rate (0-1)."""
+    if _NEWS_CACHE is None:
+        return {"hits": 0, "misses": 0, "size": 0, "hit_rate": 0.0}
+    return _NEWS_CACHE.stats()
+
+
+def clear_news_cache() -> None:
+    """Drop all cached news and reset the counters."""
+    if _NEWS_CACHE is not None:
+        _NEWS_CACHE.clear()
+
+
+# News signal rules: (signal type, keywords, description template), in priority
+# order (first type that matches an article wins)
+NEWS_SIGNAL_RULES = (
+    ("hiring", ("hiring", "recrute", "job opening", "open position", "career"),
+     "{company} a récemment publié des offres d'emploi"),
+    ("funding", ("funding", "raise", "investment", "series", "financement"),
+     "{company} a récemment levé des fonds"),
+    ("expansion", ("expansion", "growth", "new office", "scale", "croissance"),
+     "{company} est en phase d'expansion"),
+    ("tech_change", ("new technology", "migration", "adopted", "tech stack", "platform"),
+     "{company} a récemment changé sa stack technologique"),
+    ("award", ("award", "recognition", "prize", "winner", "prix", "récompense"),
+     "{company} a récemment reçu une distinction"),
+    ("leadership", ("new ceo", "new cto", "new cmo", "appointed", "joins as"),
+     "{company} a récemment changé de direction"),
+)
+
+NEWS_SIGNAL_KEYWORDS = tuple((signal_type, keywords) for signal_type, keywords, _ in NEWS_SIGNAL_RULES)
+NEWS_SIGNAL_DESCRIPTIONS = {signal_type: template for signal_type, _, template in NEWS_SIGNAL_RULES}
+
+# Website signal rules: (signal type, keywords, description template, confidence),
+# checked in order against the scraped website content
+SITE_SIGNAL_RULES = (
+    ("hiring", ("career", "job", "join our team", "we're hiring", "open position"),
+     "{company} recrute actuellement", 4),
+    ("expansion", ("new office", "expansion", "growing team", "scaling"),
+     "{company} est en phase de croissance", 3),
+)
+
+_MIN_NEWS_KEYWORD_LEN = min(len(kw) for _, keywords in NEWS_SIGNAL_KEYWORDS for kw in keywords)
+
+# Rule tables scanned by the shared automaton (by source: news articles, website content)
+SIGNAL_RULE_SETS = {"news": NEWS_SIGNAL_RULES, "site": SITE_SIGNAL_RULES}
+
+
+def _build_signal_db(source: str, rules):
+    """
+    Compile a rule table's keywords into a single Hyperscan database.
+
+    One expression per rule, with the rule's index as match id.
+    Returns None if hyperscan is not installed (the automaton is used).
+    """
+    return compile_keyword_db(
+        f"{source} signal",
+        ["|".join(re.escape(kw) for kw in rule[1]) for rule in rules],
+    )
+
+
+_SIGNAL_DBS = {source: _build_signal_db(source, rules) for source, rules in SIGNAL_RULE_SETS.items()}
+
+
+def _scan_signal_db(db, text_lower: str) -> Optional[int]:
+    """Return the index of the highest-priority rule matched by a Hyperscan database."""
+    matched_ids = db.scan(text_lower, stop_on=0)  # Top-priority rule: stop scanning
+    return min(matched_ids) if matched_ids else None
+
+
+def _build_signal_automaton():
+    """
+    Build one Aho-Corasick automaton over the keywords of every rule table.
+
+    Each keyword maps to {source: index of the first rule of that source
+    listing it}, so news and website scans share a single automaton.
+
+    Returns None if pyahocorasick is not installed (substring scan is used).
+    """
+    if ahocorasick is None:
+        return None
+
+    rules_by_keyword: Dict[str, Dict[str, int]] = {}
+    for source, rules in SIGNAL_RULE_SETS.items():
+        for i, rule in enumerate(rules):
+            for keyword in rule[1]:
+                rules_by_keyword.setdefault(keyword, {}).setdefault(source, i)
+
+    automaton = ahocorasick.Automaton()
+    for keyword, rule_indexes in rules_by_keyword.items():
+        automaton.add_word(keyword, rule_indexes)
+    automaton.make_automaton()
+    return automaton
+
+
+_SIGNAL_AUTOMATON = _build_signal_automaton()
+
+
+def scan_for_signals(text_lower: str, source: str) -> Optional[int]:
+    """
+    Return the index of the first rule of SIGNAL_RULE_SETS[source] matching a (lowercased) text.
+
+    One automaton pass collects every keyword hit; the hit with the best
+    priority wins, regardless of where it appears in the text.
+
+    Text is lowercased by the caller rather than matched with re.IGNORECASE:
+    case-insensitive alternations are ~20x slower on CPython than lower()
+    plus an automaton pass over 300-6000 character articles. Hyperscan, when
+    installed, scans ~15x faster than the automaton on such articles.
+    """
+    db = _SIGNAL_DBS[source]
+    if db is not None:
+        return _scan_signal_db(db, text_lower)
+
+    if _SIGNAL_AUTOMATON is not None:
+        best = None
+        for _, rule_indexes in _SIGNAL_AUTOMATON.iter(text_lower):
+            i = rule_indexes.get(source)
+            if i is not None and (best is None or i < best):
+                best = i
+                if best == 0:
+                    break
+        return best
+
+    # Plain substring checks: str.find is faster here than a re alternation
+    for i, rule in enumerate(SIGNAL_RULE_SETS[source]):
+        if any(kw in text_lower for kw in rule[1]):
+            return i
+    return None
+
+
+def detect_news_signal(text_lower: str) -> Optional[str]:
+    """Return the highest-priority signal type mentioned in a (lowercased) article."""
+    i = scan_for_signals(text_lower, "news")
+    return None if i is None else NEWS_SIGNAL_RULES[i][0]
+
+
+def classify_corpus(texts: Iterable[Optional[str]], source: str = "news") -> List[Optional[str]]:
+    """
+    Classify a bulk corpus (offline enrichment jobs): one signal type or None per text.
+
+    Each text is lowercased and scanned once (Hyperscan or the shared native
+    automaton), so the per-text Python work is a single call.
+
+    Args:
+        texts: Article bodies or website contents (None counts as empty)
+        source: Rule table to apply ("news" or "site")
+
+    Returns:
+        Signal types, in the same order as texts
+    """
+    rules = SIGNAL_RULE_SETS[source]
+    types = [rule[0] for rule in rules]
+    results = []
+    for text in texts:
+        i = scan_for_signals(text.lower(), source) if text else None
+        results.append(None if i is None else types[i])
+    return results
+
+
+# Industries where companies are assumed to be hiring (industry inference)
+HIGH_GROWTH_INDUSTRY_KEYWORDS = ("saas", "tech", "startup")
+_HIGH_GROWTH_PATTERN = "|".join(HIGH_GROWTH_INDUSTRY_KEYWORDS)
+
+
+@lru_cache(maxsize=1024)
+def is_high_growth_industry(industry: str) -> bool:
+    """
+    Return True if an industry mentions a high-growth keyword (case-insensitive).
+
+    Memoized: a batch only has a handful of distinct industry strings.
+    """
+    industry_lower = industry.lower()
+    return any(kw in industry_lower for kw in HIGH_GROWTH_INDUSTRY_KEYWORDS)
+
+
+def classify_industries(industries: Union["pd.Series", Sequence[Optional[str]]]) -> Union["pd.Series", List[bool]]:
+    """
+    Flag high-growth industries for a whole batch of prospects.
+
+    A pandas Series is classified with one vectorized string operation;
+    any other sequence goes through is_high_growth_industry().
+
+    Args:
+        industries: Industry strings (None/NaN counts as no industry)
+
+    Returns:
+        Boolean Series (same index) for a Series input, list of bools otherwise
+    """
+    if pd is not None and isinstance(industries, pd.Series):
+        return industries.fillna("").astype(str).str.lower().str.contains(_HIGH_GROWTH_PATTERN, regex=True)
+    return [bool(industry) and is_high_growth_industry(industry) for industry in industries]
+
+
+# Why a signal type matters to a client: (pain_solved keywords, message) pairs
+# checked in order (substring match), then a per-type default message
+SIGNAL_RELEVANCE_RULES = {
+    "hiring": (
+        (("lead", "sales", "client acquisition"),
+         "Le recrutement indique une phase de croissance → besoin de leads qualifiés"),
+        (("rh", "recruit", "talent"),
+         "Le recrutement actif indique un besoin d'outils RH efficaces"),
+    ),
+    "funding": (
+        (("lead", "sales"),
+         "La levée de fonds indique budget disponible pour outils de croissance"),
+    ),
+    "expansion": (
+        (("lead", "sales"),
+         "L'expansion nécessite plus de clients → besoin de lead gen"),
+        (("ops", "process"),
+         "L'expansion nécessite des processus scalables"),
+    ),
+    "tech_change": (
+        (("devops", "cloud", "infrastructure"),
+         "Le changement tech indique ouverture à de nouvelles solutions"),
+    ),
+}
+
+SIGNAL_RELEVANCE_DEFAULTS = {
+    "hiring": "Le recrutement indique une phase de croissance et d'investissement",
+    "funding": "La levée de fonds indique capacité d'investissement dans de nouveaux outils",
+    "expansion": "L'expansion indique besoin d'outils pour scaler",
+    "tech_change": "Le changement tech indique période de modernisation",
+    "award": "La reconnaissance indique ambition de croissance et excellence",
+    "leadership": "Un nouveau leadership signifie souvent de nouvelles priorités et budgets",
+}
+
+DEFAULT_RELEVANCE = "Signal indique opportunité de contact"
+
+
+def _relevance(pain_lower: str, signal_type: str) -> str:
+    """Explain why a signal type is relevant to a client (by its lowercased pain_solved)."""
+    for keywords, message in SIGNAL_RELEVANCE_RULES.get(signal_type, ()):
+        if any(kw in pain_lower for kw in keywords):
+            return message
+    return SIGNAL_RELEVANCE_DEFAULTS.get(signal_type, DEFAULT_RELEVANCE)
+
+
+@lru_cache(maxsize=256)
+def relevance_plan(pain_lower: str) -> Mapping[str, str]:
+    """
+    Relevance message for every signal type, for one client's lowercased pain_solved.
+
+    Computed once per client: relevance only depends on the client, never on
+    the prospect, so building a signal is then a single (read-only) dict lookup.
+    """
+    return MappingProxyType({
+        signal_type: _relevance(pain_lower, signal_type)
+        for signal_type in SIGNAL_RELEVANCE_DEFAULTS
+    })
+
 
 class SignalDetectorInputSchema(BaseModel):
     """Input schema for Signal Detector."""
@@ -48,6 +359,10 @@ class SignalDetectorOutputSchema(BaseModel):
     signal_date: Optional[str] = Field(default=None, description="Date of signal (if known)")
 
 
+# Built once at import: validates a whole batch of raw prospect dicts in one call
+SignalDetectorInputBatchAdapter = TypeAdapter(List[SignalDetectorInputSchema])
+
+
 class SignalDetectorV3:
     """
     v3.0 Signal Detector Agent.
@@ -96,6 +411,7 @@ class SignalDetectorV3:
         self.enable_scraping = enable_scraping
         self.enable_tavily = enable_tavily
         self.client_context = client_context
+        self._relevance_plan = relevance_plan(client_context.pain_solved_lower) if client_context else None
 
         # Initialize Tavily client
         self.tavily = None
@@ -103,7 +419,7 @@ class SignalDetectorV3:
             try:
                 self.tavily = get_tavily_client()
             except Exception as e:
-                print(f"Warning: Could not initialize Tavily: {e}")
+                logger.warning("Could not initialize Tavily: %s", e)
 
     def run(self, input_data: SignalDetectorInputSchema) -> SignalDetectorOutputSchema:
         """
@@ -127,6 +443,15 @@ class SignalDetectorV3:
             if result:
                 return result
 
+        return self._run_offline_strategies(input_data)
+
+    def _run_offline_strategies(self, input_data: SignalDetectorInputSchema) -> SignalDetectorOutputSchema:
+        """
+        Strategies 2-4 of run() (no network calls).
+
+        Returns:
+            SignalDetectorOutputSchema with signal info
+        """
         # Strategy 2: Scrape prospect's website (news/blog)
         if self.enable_scraping and input_data.website_content:
             result = self._try_scrape_news(input_data)
@@ -141,6 +466,72 @@ class SignalDetectorV3:
         # Strategy 4: No signal found
         return self._no_signal_found(input_data)
 
+    async def arun(self, input_data: SignalDetectorInputSchema) -> SignalDetectorOutputSchema:
+        """
+        Async version of run().
+
+        The Tavily news search is awaited instead of blocking the event loop;
+        the remaining strategies are CPU-only and run inline.
+
+        Args:
+            input_data: Prospect information
+
+        Returns:
+            SignalDetectorOutputSchema with signal info
+        """
+        # Strategy 1: Tavily news search
+        if self.tavily and self.tavily.enabled:
+            result = await self._atry_tavily_news_search(input_data)
+            if result:
+                return result
+
+        return self._run_offline_strategies(input_data)
+
+    async def arun_many(
+        self,
+        inputs: Sequence[Union[SignalDetectorInputSchema, dict]],
+        concurrency: int = 16
+    ) -> List[SignalDetectorOutputSchema]:
+        """
+        Detect buying signals for a batch of prospects.
+
+        Tavily news searches are issued concurrently (one per distinct company,
+        at most `concurrency` in flight), then every prospect is classified
+        synchronously.
+
+        Args:
+            inputs: Prospects (schemas or raw dicts, validated in one pass)
+            concurrency: Maximum number of concurrent Tavily searches
+
+        Returns:
+            List of SignalDetectorOutputSchema, in the same order as inputs
+        """
+        prospects = SignalDetectorInputBatchAdapter.validate_python(list(inputs))
+
+        if not (self.tavily and self.tavily.enabled):
+            return [self._run_offline_strategies(input_data) for input_data in prospects]
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def search_one(input_data):
+            async with semaphore:
+                return await self._atry_tavily_news_search(input_data)
+
+        # Duplicate companies share one search
+        first_by_company = {}
+        for input_data in prospects:
+            first_by_company.setdefault(input_data.company_name, input_data)
+        tavily_results = dict(zip(
+            first_by_company,
+            await asyncio.gather(*(search_one(x) for x in first_by_company.values()))
+        ))
+
+        # A web_search signal only depends on the company name: duplicates reuse it
+        return [
+            tavily_results[input_data.company_name] or self._run_offline_strategies(input_data)
+            for input_data in prospects
+        ]
+
     def _try_tavily_news_search(self, input_data: SignalDetectorInputSchema) -> Optional[SignalDetectorOutputSchema]:
         """
         Try to find signals using Tavily news search.
@@ -150,96 +541,108 @@ class SignalDetectorV3:
         Returns:
             SignalDetectorOutputSchema if found, None otherwise
         """
-        try:
-            print(f"[SignalDetectorV3] Using Tavily to find signals for {input_data.company_name}")
+        key = _news_cache_key(input_data.company_name)
+        news = get_cached_news(key)
+        if news is not None:
+            self._log_cache_hit(input_data)
+            return self._signal_from_news(input_data, news)
 
+        logger.debug("Using Tavily to find signals for %s", input_data.company_name)
+        try:
             # Search for recent news
             news = self.tavily.search_company_news(
                 company_name=input_data.company_name,
-                months=3
+                months=NEWS_MONTHS
             )
+        except Exception as e:
+            logger.warning("Tavily search failed for %s: %s", input_data.company_name, e)
+            return None
 
-            if not news:
-                print(f"[SignalDetectorV3] Tavily found no news")
-                return None
+        cache_news(key, news)
+        return self._signal_from_news(input_data, news)
 
-            # Analyze news for signals
-            for article in news:
-                title = article.get("title", "").lower()
-                content = article.get("content", "").lower()
-                combined = f"{title} {content}"
+    async def _atry_tavily_news_search(self, input_data: SignalDetectorInputSchema) -> Optional[SignalDetectorOutputSchema]:
+        """
+        Async version of _try_tavily_news_search().
 
-                # HIRING signal
-                if any(kw in combined for kw in ["hiring", "recrute", "job opening", "open position", "career"]):
-                    return self._build_signal(
-                        signal_type="hiring",
-                        description=f"{input_data.company_name} a récemment publié des offres d'emploi",
-                        input_data=input_data,
-                        confidence=5,
-                        source="web_search",
-                        date=article.get("published_date")
-                    )
+        Returns:
+            SignalDetectorOutputSchema if found, None otherwise
+        """
+        key = _news_cache_key(input_data.company_name)
+        news = get_cached_news(key)
+        if news is not None:
+            self._log_cache_hit(input_data)
+            return self._signal_from_news(input_data, news)
 
-                # FUNDING signal
-                if any(kw in combined for kw in ["funding", "raise", "investment", "series", "financement"]):
-                    return self._build_signal(
-                        signal_type="funding",
-                        description=f"{input_data.company_name} a récemment levé des fonds",
-                        input_data=input_data,
-                        confidence=5,
-                        source="web_search",
-                        date=article.get("published_date")
-                    )
+        logger.debug("Using Tavily to find signals for %s", input_data.company_name)
+        try:
+            # Search for recent news
+            news = await self.tavily.asearch_company_news(
+                company_name=input_data.company_name,
+                months=NEWS_MONTHS
+            )
+        except Exception as e:
+            logger.warning("Tavily search failed for %s: %s", input_data.company_name, e)
+            return None
 
-                # EXPANSION signal
-                if any(kw in combined for kw in ["expansion", "growth", "new office", "scale", "croissance"]):
-                    return self._build_signal(
-                        signal_type="expansion",
-                        description=f"{input_data.company_name} est en phase d'expansion",
-                        input_data=input_data,
-                        confidence=5,
-                        source="web_search",
-                        date=article.get("published_date")
-                    )
+        cache_news(key, news)
+        return self._signal_from_news(input_data, news)
 
-                # TECH CHANGE signal
-                if any(kw in combined for kw in ["new technology", "migration", "adopted", "tech stack", "platform"]):
-                    return self._build_signal(
-                        signal_type="tech_change",
-                        description=f"{input_data.company_name} a récemment changé sa stack technologique",
-                        input_data=input_data,
-                        confidence=5,
-                        source="web_search",
-                        date=article.get("published_date")
-                    )
+    @staticmethod
+    def _log_cache_hit(input_data: SignalDetectorInputSchema) -> None:
+        if logger.isEnabledFor(logging.DEBUG):
+            stats = news_cache_stats()
+            logger.debug(
+                "Tavily news cache hit for %s (hit rate %.0f%%, %d companies cached)",
+                input_data.company_name, stats["hit_rate"] * 100, stats["size"]
+            )
 
-                # AWARD signal
-                if any(kw in combined for kw in ["award", "recognition", "prize", "winner", "prix", "récompense"]):
-                    return self._build_signal(
-                        signal_type="award",
-                        description=f"{input_data.company_name} a récemment reçu une distinction",
-                        input_data=input_data,
-                        confidence=5,
-                        source="web_search",
-                        date=article.get("published_date")
-                    )
+    def _signal_from_news(
+        self,
+        input_data: SignalDetectorInputSchema,
+        news: List[Dict[str, Any]]
+    ) -> Optional[SignalDetectorOutputSchema]:
+        """
+        Find the first buying signal in Tavily news articles (CPU only).
+
+        Args:
+            input_data: Prospect information
+            news: News items from the Tavily client
 
-                # LEADERSHIP signal
-                if any(kw in combined for kw in ["new ceo", "new cto", "new cmo", "appointed", "joins as"]):
+        Returns:
+            SignalDetectorOutputSchema if found, None otherwise
+        """
+        try:
+            if not news:
+                logger.debug("Tavily found no news for %s", input_data.company_name)
+                return None
+
+            # Analyze news for signals
+            for article in news:
+                title = article.get("title") or ""
+                content = article.get("content") or ""
+                if len(title) + len(content) < _MIN_NEWS_KEYWORD_LEN:
+                    continue  # Empty (or too short to contain any keyword)
+
+                # One lowercase pass over the joined text (keywords may span the join)
+                combined = f"{title} {content}".lower()
+
+                signal_type = detect_news_signal(combined)
+                if signal_type:
                     return self._build_signal(
-                        signal_type="leadership",
-                        description=f"{input_data.company_name} a récemment changé de direction",
+                        signal_type=signal_type,
+                        description=NEWS_SIGNAL_DESCRIPTIONS[signal_type].format(company=input_data.company_name),
                         input_data=input_data,
                         confidence=5,
                         source="web_search",
                         date=article.get("published_date")
                     )
 
-            print(f"[SignalDetectorV3] Tavily found news but no relevant signals")
+            logger.debug("Tavily found news but no relevant signals for %s", input_data.company_name)
             return None
 
         except Exception as e:
-            print(f"[SignalDetectorV3] Tavily search failed: {e}")
+            logger.warning("Tavily news analysis failed for %s: %s", input_data.company_name, e)
             return None
 
     def _try_scrape_news(self, input_data: SignalDetectorInputSchema) -> Optional[SignalDetectorOutputSchema]:
@@ -256,27 +659,19 @@ class SignalDetectorV3:
         """
         content = input_data.website_content.lower()
 
-        # HIRING signal from career page
-        if any(kw in content for kw in ["career", "job", "join our team", "we're hiring", "open position"]):
-            return self._build_signal(
-                signal_type="hiring",
-                description=f"{input_data.company_name} recrute actuellement",
-                input_data=input_data,
-                confidence=4,
-                source="site_scrape"
-            )
-
-        # EXPANSION signal
-        if any(kw in content for kw in ["new office", "expansion", "growing team", "scaling"]):
-            return self._build_signal(
-                signal_type="expansion",
-                description=f"{input_data.company_name} est en phase de croissance",
-                input_data=input_data,
-                confidence=3,
-                source="site_scrape"
-            )
+        # HIRING signal from career page, then EXPANSION signal
+        i = scan_for_signals(content, "site")
+        if i is None:
+            return None
 
-        return None
+        signal_type, _, template, confidence = SITE_SIGNAL_RULES[i]
+        return self._build_signal(
+            signal_type=signal_type,
+            description=template.format(company=input_data.company_name),
+            input_data=input_data,
+            confidence=confidence,
+            source="site_scrape"
+        )
 
     def _try_industry_inference(self, input_data: SignalDetectorInputSchema) -> Optional[SignalDetectorOutputSchema]:
         """
@@ -286,9 +681,7 @@ class SignalDetectorV3:
             SignalDetectorOutputSchema with inferred signal
         """
         # Only use inference for high-growth industries
-        industry_lower = input_data.industry.lower()
-
-        if any(kw in industry_lower for kw in ["saas", "tech", "startup"]):
+        if is_high_growth_industry(input_data.industry):
             # Tech companies often hire
             return self._build_signal(
                 signal_type="hiring",
@@ -307,7 +700,8 @@ class SignalDetectorV3:
         Returns:
             SignalDetectorOutputSchema with signal_type="none"
         """
-        return SignalDetectorOutputSchema(
+        # Built from agent constants: skip Pydantic validation
+        return SignalDetectorOutputSchema.model_construct(
             signal_type="none",
             signal_description="Aucun signal d'achat détecté récemment",
             relevance_to_client="N/A",
@@ -343,7 +737,8 @@ class SignalDetectorV3:
         # Determine relevance based on client context and signal type
         relevance = self._determine_relevance(signal_type, input_data)
 
-        return SignalDetectorOutputSchema(
+        # signal_type and relevance come from the agent's own tables: skip Pydantic validation
+        return SignalDetectorOutputSchema.model_construct(
             signal_type=signal_type,
             signal_description=description,
             relevance_to_client=relevance,
@@ -365,53 +760,10 @@ class SignalDetectorV3:
         Returns:
             Relevance explanation
         """
-        if not self.client_context:
+        if self._relevance_plan is None:
             return "Signal indique une opportunité potentielle"
 
-        pain_lower = self.client_context.pain_solved.lower()
-
-        # HIRING signal relevance
-        if signal_type == "hiring":
-            if any(kw in pain_lower for kw in ["lead", "sales", "client acquisition"]):
-                return "Le recrutement indique une phase de croissance → besoin de leads qualifiés"
-            elif any(kw in pain_lower for kw in ["rh", "recruit", "talent"]):
-                return "Le recrutement actif indique un besoin d'outils RH efficaces"
-            else:
-                return "Le recrutement indique une phase de croissance et d'investissement"
-
-        # FUNDING signal relevance
-        elif signal_type == "funding":
-            if any(kw in pain_lower for kw in ["lead", "sales"]):
-                return "La levée de fonds indique budget disponible pour outils de croissance"
-            else:
-                return "La levée de fonds indique capacité d'investissement dans de nouveaux outils"
-
-        # EXPANSION signal relevance
-        elif signal_type == "expansion":
-            if any(kw in pain_lower for kw in ["lead", "sales"]):
-                return "L'expansion nécessite plus de clients → besoin de lead gen"
-            elif any(kw in pain_lower for kw in ["ops", "process"]):
-                return "L'expansion nécessite des processus scalables"
-            else:
-                return "L'expansion indique besoin d'outils pour scaler"
-
-        # TECH CHANGE signal relevance
-        elif signal_type == "tech_change":
-            if any(kw in pain_lower for kw in ["devops", "cloud", "infrastructure"]):
-                return "Le changement tech indique ouverture à de nouvelles solutions"
-            else:
-                return "Le changement tech indique période de modernisation"
-
-        # AWARD signal relevance
-        elif signal_type == "award":
-            return "La reconnaissance indique ambition de croissance et excellence"
-
-        # LEADERSHIP signal relevance
-        elif signal_type == "leadership":
-            return "Un nouveau leadership signifie souvent de nouvelles priorités et budgets"
-
-        else:
-            return "Signal indique opportunité de contact"
+        return self._relevance_plan.get(signal_type, DEFAULT_RELEVANCE)
 
 
 # Example usage
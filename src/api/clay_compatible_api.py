@@ -5,6 +5,7 @@ Clay peut appeler ces endpoints via HTTP Request enrichment.
 
 Endpoints:
     POST /api/generate-email - Generate un email complet
+    POST /api/generate-email/stream - Idem, variables streamees (SSE)
     POST /api/extract-persona - Agent 1 seulement
     POST /api/find-competitor - Agent 2 seulement
     POST /api/identify-pain - Agent 3 seulement
@@ -15,13 +16,22 @@ Endpoints:
 
 from fastapi import FastAPI, HTTPException, Header, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, List
+from typing import Any, AsyncIterator, Callable, Hashable, Iterator, Optional, Dict, List, Tuple
+from contextlib import contextmanager
+from functools import lru_cache
+import asyncio
+import hashlib
+import json
+import logging
 import os
+import threading
 from dotenv import load_dotenv
 
 from src.orchestrator import CampaignOrchestrator
 from src.schemas.campaign_schemas import CampaignRequest, Contact
+from src.utils.ttl_cache import TTLCache
 from src.agents.agents_v2 import (
     PersonaExtractorAgent,
     CompetitorFinderAgent,
@@ -32,19 +42,37 @@ from src.agents.agents_v2 import (
 )
 from src.schemas.agent_schemas_v2 import (
     PersonaExtractorInputSchema,
+    PersonaExtractorOutputSchema,
     CompetitorFinderInputSchema,
+    CompetitorFinderOutputSchema,
     PainPointInputSchema,
+    PainPointOutputSchema,
     SignalGeneratorInputSchema,
     SystemBuilderInputSchema,
     CaseStudyInputSchema
 )
 
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import RedisError
+except ImportError:
+    aioredis = None
+    RedisError = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 app = FastAPI(
     title="Clay-Compatible Email Generation API",
     description="API pour generer des emails personnalises depuis Clay",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS pour permettre les appels depuis Clay
@@ -69,6 +97,232 @@ def verify_api_key(x_api_key: str = Header(...)):
     return x_api_key
 
 
+# ============================================
+# Blocking work (LLM pipeline)
+# ============================================
+
+# The orchestrator and the agents are synchronous: they run in worker
+# threads so the event loop keeps serving other Clay requests meanwhile.
+# At most ORCH_CONCURRENCY of them run at once.
+ORCH_CONCURRENCY = int(os.getenv("ORCH_CONCURRENCY", "16"))
+_blocking_slots = asyncio.Semaphore(ORCH_CONCURRENCY)
+
+DEFAULT_TEMPLATE_PATH = "data/templates/cold_email_template_example.md"
+
+
+async def run_blocking(func: Callable[..., Any], *args: Any) -> Any:
+    """Run a blocking call in a worker thread (bounded by ORCH_CONCURRENCY)."""
+    async with _blocking_slots:
+        return await asyncio.to_thread(func, *args)
+
+
+class InFlightCoalescer:
+    """
+    Share one pipeline run between identical requests in flight.
+
+    Clay fires rows in parallel and re-runs the same rows: concurrent
+    requests with the same key await the same blocking call instead of each
+    paying for its own LLM calls. Once the call finishes, the next request
+    with that key starts a new run. One coalescer per endpoint.
+    """
+
+    def __init__(self):
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, key: Hashable, func: Callable[..., Any], *args: Any) -> Any:
+        """Run `func(*args)` via run_blocking, or join the run in flight for `key`."""
+        future = self._pending.get(key)
+        if future is None:
+            future = asyncio.ensure_future(run_blocking(func, *args))
+            self._pending[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        # A client disconnecting must not cancel the run for the others
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: asyncio.Future):
+        self._pending.pop(key, None)
+        if not future.cancelled():
+            future.exception()  # Retrieved here if every waiter went away
+
+
+# Agent results for identical inputs (Clay re-enriches the same rows):
+# per process, plus Redis (shared by every worker) when REDIS_URL is set
+AGENT_CACHE_TTL = 86400
+AGENT_CACHE_MAX_SIZE = 10_000
+# A slow or unreachable Redis must not hold requests: it is only a cache
+AGENT_CACHE_REDIS_TIMEOUT = 0.5  # seconds
+
+
+class AgentResultCache:
+    """
+    Two-level cache of agent outputs keyed on a hash of the agent inputs.
+
+    The in-process TTLCache is checked first, then Redis if configured
+    (outputs stored as JSON and re-validated on read). Redis errors are
+    logged and treated as misses: the local cache keeps working.
+    """
+
+    def __init__(self):
+        self.local = TTLCache(maxsize=AGENT_CACHE_MAX_SIZE, ttl=AGENT_CACHE_TTL)
+        redis_url = os.getenv("REDIS_URL")
+        self.redis = None
+        if redis_url and aioredis is not None:
+            self.redis = aioredis.from_url(
+                redis_url,
+                socket_timeout=AGENT_CACHE_REDIS_TIMEOUT,
+                socket_connect_timeout=AGENT_CACHE_REDIS_TIMEOUT
+            )
+
+    @staticmethod
+    def key(agent_class, input_data: BaseModel) -> str:
+        digest = hashlib.blake2b(input_data.model_dump_json().encode("utf-8"), digest_size=16)
+        return f"agent:{agent_class.__name__}:{digest.hexdigest()}"
+
+    async def get(self, key: str, output_class) -> Optional[BaseModel]:
+        result = self.local.get(key)
+        if result is None and self.redis is not None:
+            try:
+                raw = await self.redis.get(key)
+            except RedisError as e:
+                logger.warning("Agent cache: Redis read failed, using the local cache only: %s", e)
+                return None
+            if raw is not None:
+                result = output_class.model_validate_json(raw)
+                self.local.set(key, result)
+        return result
+
+    async def set(self, key: str, result: BaseModel):
+        self.local.set(key, result)
+        if self.redis is not None:
+            try:
+                await self.redis.set(key, result.model_dump_json(), ex=AGENT_CACHE_TTL)
+            except RedisError as e:
+                logger.warning("Agent cache: Redis write failed, result kept in the local cache only: %s", e)
+
+
+agent_results = AgentResultCache()
+
+
+@lru_cache(maxsize=8)
+def load_template(template_path: str) -> str:
+    """Read a template file once (its content before the first '---')."""
+    with open(template_path, "r", encoding="utf-8") as f:
+        return f.read().split("---")[0].strip()
+
+
+class OrchestratorPool:
+    """
+    Idle CampaignOrchestrators kept per model and reused across requests.
+
+    Building an orchestrator loads every context file and six agents. Its
+    per-company result cache is not reused: it is keyed on company and
+    website only, but holds the contact's first name and variables that
+    depend on the request's directives. An orchestrator serves one request
+    at a time (its agents are not thread-safe), so the pool grows to the
+    number of concurrent requests (<= ORCH_CONCURRENCY).
+    """
+
+    def __init__(self):
+        self._idle: Dict[str, List[CampaignOrchestrator]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def checkout(self, model: str) -> Iterator[CampaignOrchestrator]:
+        """Borrow an orchestrator for `model` (built if none is idle)."""
+        with self._lock:
+            idle = self._idle.setdefault(model, [])
+            orchestrator = idle.pop() if idle else None
+
+        if orchestrator is None:
+            orchestrator = CampaignOrchestrator(
+                openai_api_key=os.getenv("OPENAI_API_KEY"),
+                model=model,
+                enable_cache=True
+            )
+
+        try:
+            yield orchestrator
+        finally:
+            # Next request starts from a clean conversation and an empty cache
+            orchestrator.reset_history()
+            orchestrator.cache.clear()
+            with self._lock:
+                self._idle[model].append(orchestrator)
+
+
+orchestrator_pool = OrchestratorPool()
+
+email_requests = InFlightCoalescer()
+agent_requests = {
+    PersonaExtractorAgent: InFlightCoalescer(),
+    CompetitorFinderAgent: InFlightCoalescer(),
+    PainPointAgent: InFlightCoalescer(),
+}
+
+
+def _generate_email(campaign_request: CampaignRequest, model: str, on_stage=None):
+    """Run the full campaign pipeline for one request (blocking)."""
+    with orchestrator_pool.checkout(model) as orchestrator:
+        return orchestrator.run(campaign_request, on_stage=on_stage)
+
+
+async def _iter_generate_email(
+    campaign_request: CampaignRequest,
+    model: str
+) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    Run the pipeline in a worker thread and yield its stages as they finish.
+
+    Yields ("persona", variables), ("competitor", variables), ... as each
+    agent completes, then ("result", CampaignResult). If the client goes
+    away, the run still completes in its thread (and releases its
+    orchestrator there).
+    """
+    loop = asyncio.get_running_loop()
+    stages: asyncio.Queue = asyncio.Queue()
+
+    def on_stage(stage: str, variables: Dict[str, Any]):
+        # Called from the worker thread
+        loop.call_soon_threadsafe(stages.put_nowait, (stage, variables))
+
+    def on_done(done: asyncio.Future):
+        if not done.cancelled():
+            done.exception()  # Retrieved here if the client went away
+        stages.put_nowait(None)
+
+    run = asyncio.ensure_future(run_blocking(_generate_email, campaign_request, model, on_stage))
+    run.add_done_callback(on_done)
+
+    while (stage := await stages.get()) is not None:
+        yield stage
+    yield "result", await run
+
+
+def _json_dumps(data: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False)
+
+
+def _run_agent(agent_class, input_data):
+    """Build an agent and run it on one input (blocking)."""
+    agent = agent_class(
+        api_key=os.getenv("OPENAI_API_KEY"),
+        model="gpt-4o-mini"
+    )
+    return agent.run(input_data)
+
+
+async def run_agent_cached(agent_class, output_class, input_data):
+    """Agent output for `input_data`: cached, joined in flight, or computed."""
+    key = AgentResultCache.key(agent_class, input_data)
+    result = await agent_results.get(key, output_class)
+    if result is None:
+        result = await agent_requests[agent_class].run(key, _run_agent, agent_class, input_data)
+        await agent_results.set(key, result)
+    return result
+
+
 # ============================================
 # Schemas pour Clay
 # ============================================
@@ -150,7 +404,7 @@ class ClayAgentResponse(BaseModel):
 # Endpoint principal: Email complet
 # ============================================
 
-@app.post("/api/generate-email", response_model=ClayEmailResponse)
+@app.post("/api/generate-email", response_model=None, responses={200: {"model": ClayEmailResponse}})
 async def generate_email_for_clay(
     request: ClayEmailRequest
     # NOTE: Authentication désactivée pour tests locaux
@@ -178,90 +432,126 @@ async def generate_email_for_clay(
     """
 
     try:
-        # Convertir le contact Clay en Contact interne
-        contact = Contact(
-            company_name=request.contact.company_name,
-            first_name=request.contact.first_name,
-            last_name=request.contact.last_name or "",
-            email=request.contact.email or "",
-            website=request.contact.website,
-            industry=request.contact.industry or ""
-        )
+        campaign_request = _build_campaign_request(request)
 
-        # Template
-        if request.template:
-            template = request.template
-        else:
-            # Template par defaut
-            template_path = "data/templates/cold_email_template_example.md"
-            if os.path.exists(template_path):
-                with open(template_path, "r", encoding="utf-8") as f:
-                    template = f.read().split("---")[0].strip()
-            else:
-                raise HTTPException(status_code=500, detail="Template par defaut introuvable")
-
-        # Orchestrateur
-        orchestrator = CampaignOrchestrator(
-            openai_api_key=os.getenv("OPENAI_API_KEY"),
-            model=request.model,
-            enable_cache=True
+        # Generer (orchestrateur dans un thread, partage entre requetes identiques)
+        result = await email_requests.run(
+            (campaign_request.template_content, request.model_dump_json(exclude={"template"})),
+            _generate_email, campaign_request, request.model
         )
 
-        # Request
-        campaign_request = CampaignRequest(
-            template_content=template,
-            contacts=[contact],
-            context={
-                "client_name": "clay-client",
-                "directives": request.directives
-            },
-            batch_id=f"clay-{contact.company_name}",
-            enable_cache=True
-        )
-
-        # Generer
-        result = orchestrator.run(campaign_request)
-
         if not result.emails_generated:
             raise HTTPException(status_code=500, detail="Echec generation email")
 
-        email = result.emails_generated[0]
-
-        # Response compatible Clay
-        return ClayEmailResponse(
-            success=True,
-            email_content=email.email_generated,
-            quality_score=email.quality_score,
-            generation_time_ms=email.generation_time_ms,
-
-            # Variables (Clay peut les mapper dans des colonnes separees)
-            target_persona=email.variables.get("target_persona", ""),
-            product_category=email.variables.get("product_category", ""),
-            competitor_name=email.variables.get("competitor_name", ""),
-            problem_specific=email.variables.get("problem_specific", ""),
-            impact_measurable=email.variables.get("impact_measurable", ""),
-            case_study_result=email.variables.get("case_study_result", ""),
-            specific_signal_1=email.variables.get("specific_signal_1", ""),
-            specific_signal_2=email.variables.get("specific_signal_2", ""),
-            specific_target_1=email.variables.get("specific_target_1", ""),
-            specific_target_2=email.variables.get("specific_target_2", ""),
-            system_1=email.variables.get("system_1", ""),
-            system_2=email.variables.get("system_2", ""),
-            system_3=email.variables.get("system_3", ""),
-
-            fallback_levels=email.fallback_levels,
-            confidence_scores=email.confidence_scores
-        )
+        return ORJSONResponse(_email_response(result.emails_generated[0]).model_dump())
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/generate-email/stream")
+async def generate_email_stream_for_clay(request: ClayEmailRequest):
+    """
+    Variante streaming (Server-Sent Events) de /api/generate-email.
+
+    Les variables sont envoyees des que chaque agent a fini, sans attendre
+    l'email complet:
+        event: persona / competitor / pain / case_study / signal / system
+        data: {variables produites par l'agent}
+    Puis un evenement final "email" (meme contenu que ClayEmailResponse),
+    ou "error" ({"detail": ...}) en cas d'echec.
+    """
+
+    async def event_generator():
+        try:
+            campaign_request = _build_campaign_request(request)
+            async for key, value in _iter_generate_email(campaign_request, request.model):
+                if key == "result":
+                    if not value.emails_generated:
+                        yield _sse("error", {"detail": "Echec generation email"})
+                    else:
+                        yield _sse("email", _email_response(value.emails_generated[0]).model_dump())
+                else:
+                    yield _sse(key, value)
+        except Exception as e:
+            detail = e.detail if isinstance(e, HTTPException) else str(e)
+            yield _sse("error", {"detail": detail})
+
+    return StreamingResponse(event_generator(), media_type="text/event-stream")
+
+
+def _build_campaign_request(request: ClayEmailRequest) -> CampaignRequest:
+    """Convertit une requete Clay en CampaignRequest (1 contact)."""
+    # Convertir le contact Clay en Contact interne
+    contact = Contact(
+        company_name=request.contact.company_name,
+        first_name=request.contact.first_name,
+        last_name=request.contact.last_name or "",
+        email=request.contact.email or "",
+        website=request.contact.website,
+        industry=request.contact.industry or ""
+    )
+
+    # Template
+    if request.template:
+        template = request.template
+    else:
+        # Template par defaut (lu une seule fois)
+        try:
+            template = load_template(DEFAULT_TEMPLATE_PATH)
+        except FileNotFoundError:
+            raise HTTPException(status_code=500, detail="Template par defaut introuvable")
+
+    return CampaignRequest(
+        template_content=template,
+        contacts=[contact],
+        context={
+            "client_name": "clay-client",
+            "directives": request.directives
+        },
+        batch_id=f"clay-{contact.company_name}",
+        enable_cache=True
+    )
+
+
+def _email_response(email) -> ClayEmailResponse:
+    """Response compatible Clay (champs issus d'un EmailResult deja valide)."""
+    return ClayEmailResponse.model_construct(
+        success=True,
+        email_content=email.email_generated,
+        quality_score=email.quality_score,
+        generation_time_ms=email.generation_time_ms,
+
+        # Variables (Clay peut les mapper dans des colonnes separees)
+        target_persona=email.variables.get("target_persona", ""),
+        product_category=email.variables.get("product_category", ""),
+        competitor_name=email.variables.get("competitor_name", ""),
+        problem_specific=email.variables.get("problem_specific", ""),
+        impact_measurable=email.variables.get("impact_measurable", ""),
+        case_study_result=email.variables.get("case_study_result", ""),
+        specific_signal_1=email.variables.get("specific_signal_1", ""),
+        specific_signal_2=email.variables.get("specific_signal_2", ""),
+        specific_target_1=email.variables.get("specific_target_1", ""),
+        specific_target_2=email.variables.get("specific_target_2", ""),
+        system_1=email.variables.get("system_1", ""),
+        system_2=email.variables.get("system_2", ""),
+        system_3=email.variables.get("system_3", ""),
+
+        fallback_levels=email.fallback_levels,
+        confidence_scores=email.confidence_scores
+    )
+
+
+def _sse(event: str, data: Any) -> str:
+    """Formate un evenement Server-Sent Events."""
+    return f"event: {event}\ndata: {_json_dumps(data)}\n\n"
+
+
 # ============================================
 # Endpoints par agent (pour usage avancé)
 # ============================================
 
-@app.post("/api/extract-persona", response_model=ClayAgentResponse)
+@app.post("/api/extract-persona", response_model=None, responses={200: {"model": ClayAgentResponse}})
 async def extract_persona(
     contact: ClayContactInput,
     api_key: str = Depends(verify_api_key)
@@ -275,11 +565,6 @@ async def extract_persona(
     """
 
     try:
-        agent = PersonaExtractorAgent(
-            api_key=os.getenv("OPENAI_API_KEY"),
-            model="gpt-4o-mini"
-        )
-
         input_data = PersonaExtractorInputSchema(
             company_name=contact.company_name,
             website=contact.website,
@@ -287,9 +572,9 @@ async def extract_persona(
             website_content=""
         )
 
-        result = agent.run(input_data)
+        result = await run_agent_cached(PersonaExtractorAgent, PersonaExtractorOutputSchema, input_data)
 
-        return ClayAgentResponse(
+        response = ClayAgentResponse.model_construct(
             success=True,
             data={
                 "target_persona": result.target_persona,
@@ -299,12 +584,13 @@ async def extract_persona(
             confidence_score=result.confidence_score,
             reasoning=result.reasoning
         )
+        return ORJSONResponse(response.model_dump())
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/find-competitor", response_model=ClayAgentResponse)
+@app.post("/api/find-competitor", response_model=None, responses={200: {"model": ClayAgentResponse}})
 async def find_competitor(
     contact: ClayContactInput,
     product_category: str,
@@ -320,11 +606,6 @@ async def find_competitor(
     """
 
     try:
-        agent = CompetitorFinderAgent(
-            api_key=os.getenv("OPENAI_API_KEY"),
-            model="gpt-4o-mini"
-        )
-
         input_data = CompetitorFinderInputSchema(
             company_name=contact.company_name,
             website=contact.website,
@@ -333,9 +614,9 @@ async def find_competitor(
             website_content=""
         )
 
-        result = agent.run(input_data)
+        result = await run_agent_cached(CompetitorFinderAgent, CompetitorFinderOutputSchema, input_data)
 
-        return ClayAgentResponse(
+        response = ClayAgentResponse.model_construct(
             success=True,
             data={
                 "competitor_name": result.competitor_name,
@@ -345,12 +626,13 @@ async def find_competitor(
             confidence_score=result.confidence_score,
             reasoning=result.reasoning
         )
+        return ORJSONResponse(response.model_dump())
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/identify-pain", response_model=ClayAgentResponse)
+@app.post("/api/identify-pain", response_model=None, responses={200: {"model": ClayAgentResponse}})
 async def identify_pain(
     contact: ClayContactInput,
     target_persona: str,
@@ -367,11 +649,6 @@ async def identify_pain(
     """
 
     try:
-        agent = PainPointAgent(
-            api_key=os.getenv("OPENAI_API_KEY"),
-            model="gpt-4o-mini"
-        )
-
         input_data = PainPointInputSchema(
             company_name=contact.company_name,
             website=contact.website,
@@ -381,9 +658,9 @@ async def identify_pain(
             website_content=""
         )
 
-        result = agent.run(input_data)
+        result = await run_agent_cached(PainPointAgent, PainPointOutputSchema, input_data)
 
-        return ClayAgentResponse(
+        response = ClayAgentResponse.model_construct(
             success=True,
             data={
                 "problem_specific": result.problem_specific,
@@ -393,6 +670,7 @@ async def identify_pain(
             confidence_score=result.confidence_score,
             reasoning=result.reasoning
         )
+        return ORJSONResponse(response.model_dump())
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -408,7 +686,8 @@ async def health_check():
     return {
         "status": "healthy",
         "openai_key_configured": bool(os.getenv("OPENAI_API_KEY")),
-        "api_key_configured": bool(os.getenv("API_KEY"))
+        "api_key_configured": bool(os.getenv("API_KEY")),
+        "agent_cache": agent_results.local.stats()
     }
 
 
@@ -420,6 +699,7 @@ async def root():
         "version": "1.0.0",
         "endpoints": {
             "generate_email": "POST /api/generate-email (email complet)",
+            "generate_email_stream": "POST /api/generate-email/stream (email complet, SSE)",
             "extract_persona": "POST /api/extract-persona (agent 1)",
             "find_competitor": "POST /api/find-competitor (agent 2)",
             "identify_pain": "POST /api/identify-pain (agent 3)",
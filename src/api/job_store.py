@@ -0,0 +1,155 @@
+"""
+Stockage des jobs de campagne.
+
+Avec REDIS_URL (et le package redis installé), les jobs sont partagés entre
+tous les workers uvicorn / pods et survivent à un redémarrage: un poll sur
+/campaigns/{job_id} fonctionne quel que soit le worker qui le reçoit.
+Sans Redis, repli sur un stockage en mémoire (un seul worker).
+
+Dans les deux cas les jobs expirent après JOB_TTL_SECONDS. Le résultat d'un
+job est stocké à part, déjà sérialisé en JSON (bytes): il n'est ni re-parsé
+ni re-sérialisé à chaque poll.
+"""
+
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+# Durée de vie d'un job (et de sa progression) dans le storage
+JOB_TTL_SECONDS = int(os.getenv("JOB_TTL_SECONDS", 86400))
+
+
+class InMemoryJobStore:
+    """
+    Storage en mémoire du process, avec expiration des jobs.
+
+    Visible uniquement par le worker qui a créé le job.
+    """
+
+    def __init__(self, ttl: int = JOB_TTL_SECONDS):
+        self.ttl = ttl
+        self._jobs: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._progress: Dict[str, Dict[str, Any]] = {}
+        self._results: Dict[str, bytes] = {}
+
+    def _purge_expired(self):
+        now = time.monotonic()
+        expired = [job_id for job_id, (expires_at, _) in self._jobs.items() if expires_at <= now]
+        for job_id in expired:
+            del self._jobs[job_id]
+            self._progress.pop(job_id, None)
+            self._results.pop(job_id, None)
+
+    async def set(self, job_id: str, job: Dict[str, Any]):
+        """Enregistre (ou remplace) un job et relance son TTL"""
+        self._purge_expired()
+        self._jobs[job_id] = (time.monotonic() + self.ttl, job)
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Retourne le job, ou None s'il n'existe pas (ou a expiré)"""
+        self._purge_expired()
+        entry = self._jobs.get(job_id)
+        return entry[1] if entry else None
+
+    async def delete(self, job_id: str) -> bool:
+        """Supprime le job, sa progression et son résultat. Retourne False si le job n'existait pas"""
+        self._progress.pop(job_id, None)
+        self._results.pop(job_id, None)
+        return self._jobs.pop(job_id, None) is not None
+
+    async def set_progress(self, job_id: str, progress: Dict[str, Any]) -> bool:
+        """Enregistre la progression d'un job en cours. Retourne False (sans rien écrire) si le job n'existe plus"""
+        self._purge_expired()
+        if job_id not in self._jobs:
+            return False
+        self._progress[job_id] = progress
+        return True
+
+    async def get_progress(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Retourne la dernière progression connue du job"""
+        return self._progress.get(job_id)
+
+    async def set_result(self, job_id: str, payload: bytes):
+        """Enregistre le résultat du job, déjà sérialisé en JSON"""
+        self._results[job_id] = payload
+
+    async def get_result(self, job_id: str) -> Optional[bytes]:
+        """Retourne le résultat sérialisé du job, ou None"""
+        return self._results.get(job_id)
+
+    async def close(self):
+        pass
+
+
+class RedisJobStore:
+    """
+    Storage Redis partagé entre workers.
+
+    Clés (JSON, avec TTL):
+    - job:{job_id}          : le job (statut, erreur, dates)
+    - job:{job_id}:progress : la progression (contacts traités / total)
+    - job:{job_id}:result   : le résultat (CampaignResult sérialisé)
+    """
+
+    def __init__(self, client, ttl: int = JOB_TTL_SECONDS):
+        self.client = client
+        self.ttl = ttl
+
+    async def set(self, job_id: str, job: Dict[str, Any]):
+        """Enregistre (ou remplace) un job et relance son TTL"""
+        await self.client.set(f"job:{job_id}", json.dumps(job), ex=self.ttl)
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Retourne le job, ou None s'il n'existe pas (ou a expiré)"""
+        raw = await self.client.get(f"job:{job_id}")
+        return json.loads(raw) if raw is not None else None
+
+    async def delete(self, job_id: str) -> bool:
+        """Supprime le job, sa progression et son résultat. Retourne False si le job n'existait pas"""
+        deleted = await self.client.delete(f"job:{job_id}", f"job:{job_id}:progress", f"job:{job_id}:result")
+        return deleted > 0
+
+    async def set_progress(self, job_id: str, progress: Dict[str, Any]) -> bool:
+        """Enregistre la progression d'un job en cours. Retourne False (sans rien écrire) si le job n'existe plus"""
+        if not await self.client.exists(f"job:{job_id}"):
+            return False
+        await self.client.set(f"job:{job_id}:progress", json.dumps(progress), ex=self.ttl)
+        return True
+
+    async def get_progress(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Retourne la dernière progression connue du job"""
+        raw = await self.client.get(f"job:{job_id}:progress")
+        return json.loads(raw) if raw is not None else None
+
+    async def set_result(self, job_id: str, payload: bytes):
+        """Enregistre le résultat du job, déjà sérialisé en JSON"""
+        await self.client.set(f"job:{job_id}:result", payload, ex=self.ttl)
+
+    async def get_result(self, job_id: str) -> Optional[bytes]:
+        """Retourne le résultat sérialisé du job, ou None"""
+        return await self.client.get(f"job:{job_id}:result")
+
+    async def close(self):
+        await self.client.aclose()
+
+
+def create_job_store():
+    """
+    Crée le storage des jobs: Redis si REDIS_URL est défini, sinon en mémoire.
+    """
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url and aioredis is not None:
+        logger.info("Job storage: Redis")
+        return RedisJobStore(aioredis.from_url(redis_url))
+    if redis_url:
+        logger.warning("REDIS_URL is set but the redis package is not installed: using in-memory job storage")
+    return InMemoryJobStore()
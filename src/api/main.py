@@ -9,16 +9,28 @@ Endpoints:
 
 from fastapi import FastAPI, HTTPException, Header, BackgroundTasks, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from typing import Optional
 import uvicorn
+import asyncio
+import json
+import logging
+import logging.handlers
+import queue
+import sys
 import uuid
 import time
 import os
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from src.schemas import CampaignRequest, CampaignResult
 from src.orchestrator import CampaignOrchestrator
+from src.api.job_store import create_job_store
 
 # Load environment variables
 load_dotenv()
@@ -41,11 +53,28 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Logs des jobs: les handlers écrivent dans une queue, un thread dédié
+# (QueueListener) fait l'écriture sur stderr. Un job en arrière-plan ne bloque
+# donc jamais l'event loop sur une écriture.
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler(sys.stderr)
+_log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s [%(job_id)s] %(message)s"))
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+
 # API Key pour sécuriser l'accès
 API_KEY = os.getenv("API_KEY", "your-secure-api-key")
 
-# Storage pour les jobs (en production: utiliser Redis ou DB)
-jobs_storage = {}
+# Storage pour les jobs: Redis si REDIS_URL est défini (partagé entre workers),
+# sinon en mémoire du process. Voir src/api/job_store.py
+jobs_storage = create_job_store()
+
+# Délai max (secondes) d'écriture de la progression d'un job
+PROGRESS_WRITE_TIMEOUT = 5
 
 
 # ============================================
@@ -104,13 +133,12 @@ async def generate_campaign(
     job_id = request.batch_id or str(uuid.uuid4())
 
     # Initialise le job dans le storage
-    jobs_storage[job_id] = {
+    await jobs_storage.set(job_id, {
         "job_id": job_id,
         "status": "processing",
         "created_at": time.time(),
-        "result": None,
         "error": None
-    }
+    })
 
     # Lance la génération en arrière-plan
     background_tasks.add_task(process_campaign, job_id, request)
@@ -132,29 +160,39 @@ async def get_campaign_status(job_id: str):
         {
             "job_id": "uuid",
             "status": "processing" | "completed" | "failed",
+            "progress": {"processed", "total", "succeeded"} (si processing),
             "result": CampaignResult (si completed),
             "error": str (si failed)
         }
     """
-    if job_id not in jobs_storage:
+    job = await jobs_storage.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    job = jobs_storage[job_id]
-
-    return {
+    response = {
         "job_id": job["job_id"],
         "status": job["status"],
         "created_at": job["created_at"],
-        "result": job["result"],
+        "progress": await jobs_storage.get_progress(job_id),
+        "result": None,
         "error": job["error"]
     }
 
+    # Le résultat est stocké déjà sérialisé: avec orjson il est inséré tel quel
+    payload = await jobs_storage.get_result(job_id) if job["status"] == "completed" else None
+    if payload is not None:
+        if orjson is not None:
+            response["result"] = orjson.Fragment(payload)
+            return ORJSONResponse(response)
+        response["result"] = json.loads(payload)
+
+    return response
+
 
 @app.delete("/campaigns/{job_id}", dependencies=[Depends(verify_api_key)])
 async def delete_campaign_job(job_id: str):
     """Supprime un job du storage (cleanup)"""
-    if job_id in jobs_storage:
-        del jobs_storage[job_id]
+    if await jobs_storage.delete(job_id):
         return {"message": f"Job {job_id} deleted"}
     else:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -171,11 +209,40 @@ async def process_campaign(job_id: str, request: CampaignRequest):
     Cette fonction:
     1. Initialise l'orchestrateur
     2. Charge les Context Providers
-    3. Exécute la génération
+    3. Exécute la génération (dans un thread: elle est bloquante), en publiant
+       la progression après chaque contact
     4. Update le job storage avec le résultat
     """
+    job = await jobs_storage.get(job_id)
+    if job is None:
+        # Supprimé (ou expiré) avant d'avoir démarré
+        return
+    loop = asyncio.get_running_loop()
+    log = logging.LoggerAdapter(logger, {"job_id": job_id})
+    job_gone = False
+
+    def report_progress(processed: int, total: int, succeeded: int):
+        # Appelé depuis le thread de génération: on attend chaque écriture,
+        # pour qu'elles restent dans l'ordre et que les erreurs soient loggées
+        nonlocal job_gone
+        if job_gone:
+            return
+        future = asyncio.run_coroutine_threadsafe(
+            jobs_storage.set_progress(job_id, {
+                "processed": processed,
+                "total": total,
+                "succeeded": succeeded
+            }),
+            loop
+        )
+        try:
+            # False: job supprimé (DELETE) ou expiré pendant la génération
+            job_gone = not future.result(timeout=PROGRESS_WRITE_TIMEOUT)
+        except Exception as e:
+            log.warning("Could not store campaign progress: %s", e)
+
     try:
-        print(f"[{job_id}] Starting campaign generation for {len(request.contacts)} contacts...")
+        log.info("Starting campaign generation: contacts=%d", len(request.contacts))
 
         # Récupérer les chemins des fichiers de contexte depuis l'env
         data_dir = os.getenv("DATA_DIR", "./data")
@@ -198,27 +265,27 @@ async def process_campaign(job_id: str, request: CampaignRequest):
         )
 
         # Exécuter la génération
-        result = orchestrator.run(request)
+        result = await asyncio.to_thread(orchestrator.run, request, report_progress)
 
-        # Convert Pydantic model to dict for JSON serialization
-        result_dict = result.model_dump()
+        # Sérialisé directement en JSON (sans passer par un dict), stocké à part
+        await jobs_storage.set_result(job_id, result.model_dump_json(exclude_none=True).encode("utf-8"))
 
         # Update job storage
-        jobs_storage[job_id]["status"] = "completed"
-        jobs_storage[job_id]["result"] = result_dict
-        jobs_storage[job_id]["completed_at"] = time.time()
+        job["status"] = "completed"
+        job["completed_at"] = time.time()
+        await jobs_storage.set(job_id, job)
 
-        print(f"[{job_id}] ✅ Campaign generation completed!")
-        print(f"[{job_id}] Success rate: {result.success_rate*100:.1f}%")
-        print(f"[{job_id}] Average quality: {result.average_quality_score:.1f}/100")
+        log.info(
+            "Campaign generation completed: success_rate=%.1f%% average_quality=%.1f/100",
+            result.success_rate * 100, result.average_quality_score
+        )
 
     except Exception as e:
-        print(f"[{job_id}] ❌ Error: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        jobs_storage[job_id]["status"] = "failed"
-        jobs_storage[job_id]["error"] = str(e)
-        jobs_storage[job_id]["completed_at"] = time.time()
+        log.exception("Campaign generation failed")
+        job["status"] = "failed"
+        job["error"] = str(e)
+        job["completed_at"] = time.time()
+        await jobs_storage.set(job_id, job)
 
 
 # ============================================
@@ -228,6 +295,7 @@ async def process_campaign(job_id: str, request: CampaignRequest):
 @app.on_event("startup")
 async def startup_event():
     """Actions à effectuer au démarrage"""
+    _log_listener.start()
     print("🚀 Kaleads Atomic Agents API starting...")
     print(f"📁 Data directory: {os.getenv('DATA_DIR', './data')}")
     print(f"🔐 API secured with API Key")
@@ -238,6 +306,8 @@ async def startup_event():
 async def shutdown_event():
     """Actions à effectuer à l'arrêt"""
     print("👋 Kaleads Atomic Agents API shutting down...")
+    await jobs_storage.close()
+    _log_listener.stop()
 
 
 # ============================================
@@ -46,9 +46,11 @@ from src.agents.v3.proof_generator_v3 import ProofGeneratorInputSchema, ProofGen
 from src.agents.validator_agent import (
     EmailValidatorAgent,
     EmailValidationInputSchema,
+    validation_cache_stats,
 )
 from src.agents.pci_agent import PCIFilterAgent, batch_filter_contacts
 from src.providers.supabase_client import SupabaseClient
+from src.providers.tavily_client import close_tavily_session
 from src.models.client_context import ClientContext
 from src.agents.lead_gen_coordinator_agent import (
     LeadGenCoordinatorAgent,
@@ -89,6 +91,13 @@ app.include_router(pci_router)
 # All V2 routes available at /v2/...
 app.mount("/v2", v2_app)
 
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the shared Tavily HTTP session."""
+    await close_tavily_session()
+
+
 # In-memory batch storage (replace with Redis in production)
 BATCH_JOBS: Dict[str, Dict[str, Any]] = {}
 
@@ -436,8 +445,8 @@ async def generate_email_with_agents(
         client_context=client_context
     )
 
-    # V3 Agent 1: Persona
-    persona_result = persona_agent.run(
+    # V3 Agent 1: Persona (async Tavily search, doesn't block the event loop)
+    persona_result = await persona_agent.run_async(
         PersonaExtractorInputSchema(
             company_name=contact.company_name,
             website=contact.website,
@@ -467,8 +476,8 @@ async def generate_email_with_agents(
         )
     )
 
-    # V3 Agent 4: Signals
-    signal_result = signal_agent.run(
+    # V3 Agent 4: Signals (async Tavily search, doesn't block the event loop)
+    signal_result = await signal_agent.arun(
         SignalDetectorInputSchema(
             company_name=contact.company_name,
             website=contact.website,
@@ -477,8 +486,8 @@ async def generate_email_with_agents(
         )
     )
 
-    # V3 Agent 5: Tech Stack
-    system_result = system_agent.run(
+    # V3 Agent 5: Tech Stack (async Tavily search, doesn't block the event loop)
+    system_result = await system_agent.arun(
         SystemMapperInputSchema(
             company_name=contact.company_name,
             website=contact.website,
@@ -909,6 +918,7 @@ async def health_check():
         "openrouter_key_configured": bool(os.getenv("OPENROUTER_API_KEY")),
         "supabase_configured": bool(os.getenv("SUPABASE_URL")),
         "tavily_configured": bool(os.getenv("TAVILY_API_KEY")),
+        "validation_cache": validation_cache_stats(),
         "version": "3.0.0"
     }
 
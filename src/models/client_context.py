@@ -8,7 +8,8 @@ Key Principle: Agents are generic and reusable. ClientContext provides the
 variable that makes them specific to each client.
 """
 
-from typing import Optional, List, Dict, Any
+from functools import cached_property
+from typing import Optional, List, Dict, Any, Tuple
 from pydantic import BaseModel, Field
 from datetime import datetime
 
@@ -354,6 +355,35 @@ class ClientContext(BaseModel):
     # Utility Methods
     # ============================================
 
+    @cached_property
+    def pain_solved_lower(self) -> str:
+        """
+        Lowercased pain_solved, computed once per context.
+
+        Agents match keywords against it on every prospect; a context is
+        loaded once and reused for the whole batch.
+        """
+        return self.pain_solved.lower()
+
+    @cached_property
+    def _case_studies_by_industry(self) -> Tuple[Dict[str, CaseStudy], Tuple[Tuple[str, CaseStudy], ...]]:
+        """
+        Case studies indexed by lowercased industry, built once per context.
+
+        Returns the exact-match index (first case study wins per industry) and
+        the (industry_lower, case study) pairs in order for partial matches.
+        """
+        pairs = tuple((cs.industry.lower(), cs) for cs in self.real_case_studies)
+        exact: Dict[str, CaseStudy] = {}
+        for industry_lower, cs in pairs:
+            exact.setdefault(industry_lower, cs)
+        return exact, pairs
+
+    @cached_property
+    def _case_study_matches(self) -> Dict[str, Optional[CaseStudy]]:
+        """find_case_study_by_industry() results, memoized per lowercased industry."""
+        return {}
+
     def get_offerings_str(self, limit: int = 3, separator: str = ", ") -> str:
         """
         Get offerings as a formatted string.
@@ -419,18 +449,25 @@ class ClientContext(BaseModel):
             return None
 
         industry_lower = industry.lower()
+        matches = self._case_study_matches
+        if industry_lower in matches:
+            return matches[industry_lower]
+
+        exact, pairs = self._case_studies_by_industry
 
         # Exact match
-        for cs in self.real_case_studies:
-            if cs.industry.lower() == industry_lower:
-                return cs
+        match = exact.get(industry_lower)
 
         # Partial match (contains)
-        for cs in self.real_case_studies:
-            if industry_lower in cs.industry.lower() or cs.industry.lower() in industry_lower:
-                return cs
-
-        return None
+        if match is None:
+            match = next(
+                (cs for cs_industry, cs in pairs
+                 if industry_lower in cs_industry or cs_industry in industry_lower),
+                None
+            )
+
+        matches[industry_lower] = match
+        return match
 
     def get_best_case_study(self, prospect_industry: Optional[str] = None) -> Optional[CaseStudy]:
         """
@@ -8,7 +8,7 @@ import asyncio
 import time
 import os
 import re
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from atomic_agents.agents.base_agent import BaseAgentConfig
 from atomic_agents.lib.models.base_models import ChatMessage
 
@@ -150,12 +150,38 @@ class CampaignOrchestrator:
         case_study_config.context_providers = [self.pci_provider, self.case_study_provider, self.pain_provider]
         self.case_study_agent = CaseStudyAgent(case_study_config)
 
-    def run(self, request: CampaignRequest) -> CampaignResult:
+    def reset_history(self):
+        """
+        Vide l'historique de conversation des 6 agents.
+
+        À appeler avant de réutiliser l'orchestrateur pour une autre requête:
+        sinon chaque appel LLM renvoie aussi les échanges des requêtes
+        précédentes (prompts plus longs, contexte mélangé entre prospects).
+        """
+        for agent in (
+            self.persona_agent,
+            self.competitor_agent,
+            self.pain_agent,
+            self.signal_agent,
+            self.system_agent,
+            self.case_study_agent
+        ):
+            agent.agent.reset_history()
+
+    def run(
+        self,
+        request: CampaignRequest,
+        on_progress: Optional[Callable[[int, int, int], None]] = None,
+        on_stage: Optional[Callable[[str, Dict[str, Any]], None]] = None
+    ) -> CampaignResult:
         """
         Exécute la génération d'une campagne complète.
 
         Args:
             request: CampaignRequest avec template, contacts, et contexte
+            on_progress: Appelé après chaque contact avec (traités, total, réussis)
+            on_stage: Appelé après chaque agent avec (étape, variables produites),
+                      voir _execute_agents_workflow
 
         Returns:
             CampaignResult avec tous les emails générés et les métriques
@@ -179,7 +205,8 @@ class CampaignOrchestrator:
                 email_result = self._process_contact(
                     contact=contact,
                     template=request.template_content,
-                    context=request.context
+                    context=request.context,
+                    on_stage=on_stage
                 )
 
                 emails_generated.append(email_result)
@@ -196,7 +223,9 @@ class CampaignOrchestrator:
                 error_msg = f"❌ Error processing {contact.company_name}: {str(e)}"
                 errors.append(error_msg)
                 logs.append(error_msg)
-                continue
+            finally:
+                if on_progress is not None:
+                    on_progress(idx, len(request.contacts), len(emails_generated))
 
         # Calculer les métriques globales
         end_time = time.time()
@@ -236,7 +265,8 @@ class CampaignOrchestrator:
         self,
         contact: Contact,
         template: str,
-        context: Dict[str, str]
+        context: Dict[str, str],
+        on_stage: Optional[Callable[[str, Dict[str, Any]], None]] = None
     ) -> EmailResult:
         """
         Traite un contact individuel et génère son email.
@@ -245,6 +275,7 @@ class CampaignOrchestrator:
             contact: Contact à traiter
             template: Template d'email avec variables
             context: Contexte client (PCI, etc.)
+            on_stage: Transmis à _execute_agents_workflow (pas appelé si cache hit)
 
         Returns:
             EmailResult avec l'email généré et les métriques
@@ -259,7 +290,7 @@ class CampaignOrchestrator:
             variables = cached_data["variables"]
         else:
             # Exécuter le workflow des agents
-            variables, fallback_levels, confidence_scores, tokens = self._execute_agents_workflow(contact)
+            variables, fallback_levels, confidence_scores, tokens = self._execute_agents_workflow(contact, on_stage)
 
             # Sauvegarder dans le cache
             if self.enable_cache:
@@ -295,7 +326,11 @@ class CampaignOrchestrator:
             warnings=[]
         )
 
-    def _execute_agents_workflow(self, contact: Contact) -> tuple[Dict[str, str], Dict[str, int], Dict[str, int], int]:
+    def _execute_agents_workflow(
+        self,
+        contact: Contact,
+        on_stage: Optional[Callable[[str, Dict[str, Any]], None]] = None
+    ) -> tuple[Dict[str, str], Dict[str, int], Dict[str, int], int]:
         """
         Exécute le workflow des 6 agents.
 
@@ -304,6 +339,9 @@ class CampaignOrchestrator:
 
         Args:
             contact: Contact à enrichir
+            on_stage: Appelé dès qu'un agent a fini, avec son étape ("persona",
+                      "competitor", "pain", "case_study", "signal", "system")
+                      et les variables qu'il a produites (streaming)
 
         Returns:
             Tuple (variables, fallback_levels, confidence_scores, total_tokens)
@@ -331,6 +369,11 @@ class CampaignOrchestrator:
         confidence_scores["target_persona"] = persona_output.confidence_score
         # Approximation tokens: ~500 tokens par appel agent
         total_tokens += 500
+        if on_stage is not None:
+            on_stage("persona", {
+                "target_persona": variables["target_persona"],
+                "product_category": variables["product_category"]
+            })
 
         # Agent 2: CompetitorFinderAgent
         competitor_input = CompetitorFinderInput(
@@ -345,6 +388,11 @@ class CampaignOrchestrator:
         fallback_levels["competitor_agent"] = competitor_output.fallback_level
         confidence_scores["competitor_name"] = competitor_output.confidence_score
         total_tokens += 500
+        if on_stage is not None:
+            on_stage("competitor", {
+                "competitor_name": variables["competitor_name"],
+                "competitor_product_category": variables["competitor_product_category"]
+            })
 
         # Agent 3: PainPointAgent
         pain_input = PainPointInput(
@@ -360,6 +408,11 @@ class CampaignOrchestrator:
         fallback_levels["pain_agent"] = pain_output.fallback_level
         confidence_scores["problem_specific"] = pain_output.confidence_score
         total_tokens += 500
+        if on_stage is not None:
+            on_stage("pain", {
+                "problem_specific": variables["problem_specific"],
+                "impact_measurable": variables["impact_measurable"]
+            })
 
         # Agent 6: CaseStudyAgent
         case_study_input = CaseStudyInput(
@@ -373,6 +426,8 @@ class CampaignOrchestrator:
         fallback_levels["case_study_agent"] = case_study_output.fallback_level
         confidence_scores["case_study_result"] = case_study_output.confidence_score
         total_tokens += 500
+        if on_stage is not None:
+            on_stage("case_study", {"case_study_result": variables["case_study_result"]})
 
         # BATCH 2: Exécution séquentielle (Agent 4 → Agent 5)
 
@@ -392,6 +447,13 @@ class CampaignOrchestrator:
         fallback_levels["signal_agent"] = signal_output.fallback_level
         confidence_scores["specific_signal_1"] = signal_output.confidence_score
         total_tokens += 600  # Agent le plus complexe
+        if on_stage is not None:
+            on_stage("signal", {
+                "specific_signal_1": variables["specific_signal_1"],
+                "specific_signal_2": variables["specific_signal_2"],
+                "specific_target_1": variables["specific_target_1"],
+                "specific_target_2": variables["specific_target_2"]
+            })
 
         # Agent 5: SystemBuilderAgent (dépend d'Agent 4)
         system_input = SystemBuilderInput(
@@ -408,6 +470,12 @@ class CampaignOrchestrator:
         fallback_levels["system_agent"] = system_output.fallback_level
         confidence_scores["system_1"] = system_output.confidence_score
         total_tokens += 500
+        if on_stage is not None:
+            on_stage("system", {
+                "system_1": variables["system_1"],
+                "system_2": variables["system_2"],
+                "system_3": variables["system_3"]
+            })
 
         # Ajouter les variables de base
         variables["first_name"] = contact.first_name or ""
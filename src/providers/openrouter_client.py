@@ -10,11 +10,23 @@ Supports multiple cheap models:
 """
 
 import os
+import importlib.util
 from typing import Dict, Any, Optional
 from enum import Enum
+from functools import lru_cache
+import httpx
+import instructor
 import openai
 from pydantic import BaseModel
 
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+
+# HTTP pool shared by every agent of the process. Requests are multiplexed
+# over HTTP/2 when the h2 package is installed (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+HTTP_LIMITS = httpx.Limits(max_connections=256, max_keepalive_connections=64)
+HTTP_TIMEOUT = 60.0
+
 
 class ModelTier(str, Enum):
     """Model tiers based on cost and quality."""
@@ -133,7 +145,7 @@ class OpenRouterClient:
             )
 
         self.default_tier = default_tier
-        self.base_url = "https://openrouter.ai/api/v1"
+        self.base_url = OPENROUTER_BASE_URL
 
     def get_client(self, model_tier: Optional[ModelTier] = None) -> openai.OpenAI:
         """
@@ -201,6 +213,59 @@ class OpenRouterClient:
         return input_cost + output_cost
 
 
+@lru_cache(maxsize=4)
+def get_openai_client(api_key: Optional[str], base_url: Optional[str] = None) -> openai.OpenAI:
+    """
+    Get the shared openai.OpenAI client for an API key and base URL.
+
+    Used directly for plain (non-structured) completions, and wrapped by
+    get_instructor_client() for the agents.
+
+    Args:
+        api_key: OpenAI/OpenRouter API key
+        base_url: API base URL (None: OpenAI default)
+
+    Returns:
+        openai client
+    """
+    http_client = httpx.Client(
+        http2=HTTP2_AVAILABLE,
+        limits=HTTP_LIMITS,
+        timeout=HTTP_TIMEOUT,
+        follow_redirects=True,
+    )
+    return openai.OpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
+
+
+@lru_cache(maxsize=4)
+def get_instructor_client(api_key: Optional[str], base_url: Optional[str] = None) -> instructor.Instructor:
+    """
+    Get the shared instructor client for an API key and base URL.
+
+    Agents are rebuilt per request (each needs its own chat history), but
+    they share this client: its openai.OpenAI HTTP pool keeps connections
+    alive across requests instead of opening a new TLS session per agent.
+    Dropped in forked children and re-created on first use there.
+
+    Args:
+        api_key: OpenAI/OpenRouter API key
+        base_url: API base URL (None: OpenAI default)
+
+    Returns:
+        instructor client
+    """
+    return instructor.from_openai(get_openai_client(api_key, base_url))
+
+
+def _clear_clients():
+    get_openai_client.cache_clear()
+    get_instructor_client.cache_clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_clear_clients)
+
+
 # Task complexity assessment for each agent type
 AGENT_COMPLEXITY_MAP = {
     "persona_extractor": {
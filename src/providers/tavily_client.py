@@ -10,10 +10,116 @@ Use cases:
 - SystemMapper: Find tech stack information
 """
 
+import asyncio
+import logging
 import os
+import random
+import threading
+import time
+import weakref
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
+logger = logging.getLogger(__name__)
+
+
+# Retry transient errors (429 / 5xx / network) with exponential backoff + full jitter
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 0.2  # seconds
+RETRY_MAX_DELAY = 4.0  # seconds
+
+# REST endpoint, called over the shared aiohttp session (async) or requests session (sync)
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+TAVILY_TIMEOUT = aiohttp.ClientTimeout(total=5.0, connect=2.0) if aiohttp else None
+TAVILY_SYNC_TIMEOUT = (2.0, 5.0)  # (connect, read) seconds
+HTTP_POOL_SIZE = 32  # keep-alive connections kept by the shared requests session
+
+# Circuit breaker: stop calling Tavily after N consecutive failed searches
+BREAKER_FAIL_MAX = 20
+BREAKER_RESET_TIMEOUT = 30.0  # seconds before a trial call is allowed again
+
+
+def _is_transient_error(error: Exception) -> bool:
+    """Return True for errors worth retrying (rate limit, server error, network)."""
+    response = getattr(error, "response", None)
+    status_code = (
+        getattr(response, "status_code", None)
+        or getattr(error, "status_code", None)
+        or getattr(error, "status", None)  # aiohttp.ClientResponseError
+    )
+    if status_code is not None:
+        return status_code == 429 or 500 <= status_code < 600
+
+    name = type(error).__name__.lower()
+    return any(kw in name for kw in ("timeout", "connect", "ratelimit", "usagelimit"))
+
+
+def _search_payload(
+    api_key: str,
+    query: str,
+    max_results: int,
+    search_depth: str,
+    include_domains: Optional[List[str]],
+    exclude_domains: Optional[List[str]]
+) -> Dict[str, Any]:
+    """Build the JSON body of a Tavily REST search request."""
+    payload = {
+        "api_key": api_key,
+        "query": query,
+        "max_results": max_results,
+        "search_depth": search_depth
+    }
+    if include_domains:
+        payload["include_domains"] = include_domains
+    if exclude_domains:
+        payload["exclude_domains"] = exclude_domains
+    return payload
+
+
+def _news_items(results: Dict[str, Any]) -> List[Dict[str, str]]:
+    """Format search results as news items."""
+    news_items = []
+    for result in results.get("results", []):
+        news_items.append({
+            "title": result.get("title", ""),
+            "url": result.get("url", ""),
+            "content": result.get("content", ""),
+            "score": result.get("score", 0)
+        })
+    return news_items
+
+
+def _tech_stack_items(results: Dict[str, Any]) -> List[str]:
+    """Extract technologies from a search answer (["Unknown tech stack"] if none)."""
+    technologies = []
+    answer = results.get("answer", "")
+
+    if answer:
+        # Simple extraction
+        for separator in [", and ", " and ", ", ", "uses ", "including ", "such as "]:
+            if separator in answer.lower():
+                parts = answer.split(separator)
+                for part in parts:
+                    cleaned = part.strip().strip(".,;")
+                    if cleaned and len(cleaned) < 40:
+                        technologies.append(cleaned)
+
+    # Deduplicate
+    technologies = list(dict.fromkeys(technologies))[:8]
+
+    return technologies if technologies else ["Unknown tech stack"]
+
 
 class TavilyClient:
     """
@@ -33,6 +139,11 @@ class TavilyClient:
         self.api_key = api_key or os.getenv("TAVILY_API_KEY")
         self.enabled = bool(self.api_key)
 
+        # Circuit breaker state (shared by all agents using this client)
+        self._breaker_lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._breaker_opened_at: Optional[float] = None
+
         if self.enabled:
             try:
                 from tavily import TavilyClient as TavilySDK
@@ -92,34 +203,162 @@ class TavilyClient:
                 "error": "TAVILY_API_KEY not found"
             }
 
-        try:
-            # Call Tavily API
-            response = self.client.search(
-                query=query,
-                max_results=max_results,
-                search_depth=search_depth,
-                include_domains=include_domains,
-                exclude_domains=exclude_domains
-            )
-
-            # Format response
-            return {
-                "query": query,
-                "results": response.get("results", []),
-                "answer": response.get("answer", ""),
-                "search_depth": search_depth,
-                "timestamp": datetime.now().isoformat()
-            }
-
-        except Exception as e:
-            print(f"Tavily search error: {e}")
+        if self.circuit_open:
             return {
                 "query": query,
                 "results": [],
                 "answer": "",
-                "error": str(e)
+                "error": "Tavily circuit breaker open (too many consecutive failures)"
             }
 
+        attempt = 0
+        while True:
+            try:
+                # Call Tavily API
+                if requests is not None:
+                    # Pooled keep-alive connections (the SDK opens one per request)
+                    http_response = get_tavily_http_session().post(
+                        TAVILY_SEARCH_URL,
+                        json=_search_payload(
+                            self.api_key, query, max_results, search_depth, include_domains, exclude_domains
+                        ),
+                        timeout=TAVILY_SYNC_TIMEOUT
+                    )
+                    http_response.raise_for_status()
+                    response = http_response.json()
+                else:
+                    response = self.client.search(
+                        query=query,
+                        max_results=max_results,
+                        search_depth=search_depth,
+                        include_domains=include_domains,
+                        exclude_domains=exclude_domains
+                    )
+                self._record_success()
+
+                # Format response
+                return {
+                    "query": query,
+                    "results": response.get("results", []),
+                    "answer": response.get("answer", ""),
+                    "search_depth": search_depth,
+                    "timestamp": datetime.now().isoformat()
+                }
+
+            except Exception as e:
+                if attempt < MAX_RETRIES and _is_transient_error(e):
+                    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt))
+                    time.sleep(random.uniform(0, delay))
+                    attempt += 1
+                    continue
+
+                self._record_failure()
+                logger.warning("Tavily search error: %s", e)
+                return {
+                    "query": query,
+                    "results": [],
+                    "answer": "",
+                    "error": str(e)
+                }
+
+    async def asearch(
+        self,
+        query: str,
+        max_results: int = 5,
+        search_depth: str = "basic",
+        include_domains: Optional[List[str]] = None,
+        exclude_domains: Optional[List[str]] = None,
+        session: Optional["aiohttp.ClientSession"] = None
+    ) -> Dict[str, Any]:
+        """
+        Async version of search().
+
+        POSTs to the Tavily REST API through the running loop's shared
+        aiohttp session (see get_tavily_session) or the given one, with the
+        same retry, circuit breaker and response format as search().
+        Without aiohttp, search() runs in a worker thread.
+
+        Args:
+            query: Search query (natural language)
+            max_results: Maximum number of results to return (default: 5)
+            search_depth: "basic" or "advanced" (default: "basic")
+            include_domains: List of domains to include (e.g., ["linkedin.com"])
+            exclude_domains: List of domains to exclude
+            session: aiohttp session to use (default: the loop's shared session)
+
+        Returns:
+            Dict with search results (same format as search())
+        """
+        if not self.enabled or self.circuit_open:
+            # No network call: search() returns its error response immediately
+            return self.search(query, max_results, search_depth, include_domains, exclude_domains)
+
+        if aiohttp is None:
+            return await asyncio.to_thread(
+                self.search, query, max_results, search_depth, include_domains, exclude_domains
+            )
+
+        payload = _search_payload(
+            self.api_key, query, max_results, search_depth, include_domains, exclude_domains
+        )
+
+        if session is None:
+            session = await get_tavily_session()
+        attempt = 0
+        while True:
+            try:
+                async with session.post(TAVILY_SEARCH_URL, json=payload, timeout=TAVILY_TIMEOUT) as response:
+                    response.raise_for_status()
+                    data = await response.json()
+                self._record_success()
+
+                # Format response
+                return {
+                    "query": query,
+                    "results": data.get("results", []),
+                    "answer": data.get("answer") or "",
+                    "search_depth": search_depth,
+                    "timestamp": datetime.now().isoformat()
+                }
+
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                if attempt < MAX_RETRIES and _is_transient_error(e):
+                    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt))
+                    await asyncio.sleep(random.uniform(0, delay))
+                    attempt += 1
+                    continue
+
+                self._record_failure()
+                logger.warning("Tavily search error: %s", e)
+                return {
+                    "query": query,
+                    "results": [],
+                    "answer": "",
+                    "error": str(e)
+                }
+
+    @property
+    def circuit_open(self) -> bool:
+        """
+        True while the circuit breaker is open.
+
+        Once BREAKER_RESET_TIMEOUT has elapsed the breaker is half-open: calls
+        are allowed again and the next failure re-opens it immediately.
+        """
+        opened_at = self._breaker_opened_at
+        return opened_at is not None and time.monotonic() - opened_at < BREAKER_RESET_TIMEOUT
+
+    def _record_success(self) -> None:
+        with self._breaker_lock:
+            self._consecutive_failures = 0
+            self._breaker_opened_at = None
+
+    def _record_failure(self) -> None:
+        with self._breaker_lock:
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= BREAKER_FAIL_MAX:
+                self._breaker_opened_at = time.monotonic()
+
     def search_competitors(self, company_name: str, industry: str = "") -> List[str]:
         """
         Find competitors for a company.
@@ -196,16 +435,24 @@ class TavilyClient:
 
         results = self.search(query, max_results=5, search_depth="basic")
 
-        news_items = []
-        for result in results.get("results", []):
-            news_items.append({
-                "title": result.get("title", ""),
-                "url": result.get("url", ""),
-                "content": result.get("content", ""),
-                "score": result.get("score", 0)
-            })
+        return _news_items(results)
 
-        return news_items
+    async def asearch_company_news(self, company_name: str, months: int = 3) -> List[Dict[str, str]]:
+        """
+        Async version of search_company_news().
+
+        Args:
+            company_name: Name of the company
+            months: How many months back to search (default: 3)
+
+        Returns:
+            List of news items (same format as search_company_news())
+        """
+        query = f"Recent news about {company_name} in the last {months} months"
+
+        results = await self.asearch(query, max_results=5, search_depth="basic")
+
+        return _news_items(results)
 
     def search_tech_stack(self, company_name: str, website: str = "") -> List[str]:
         """
@@ -229,24 +476,25 @@ class TavilyClient:
 
         results = self.search(query, max_results=3, search_depth="basic")
 
-        # Extract technologies from answer
-        technologies = []
-        answer = results.get("answer", "")
+        return _tech_stack_items(results)
 
-        if answer:
-            # Simple extraction
-            for separator in [", and ", " and ", ", ", "uses ", "including ", "such as "]:
-                if separator in answer.lower():
-                    parts = answer.split(separator)
-                    for part in parts:
-                        cleaned = part.strip().strip(".,;")
-                        if cleaned and len(cleaned) < 40:
-                            technologies.append(cleaned)
+    async def asearch_tech_stack(self, company_name: str, website: str = "") -> List[str]:
+        """
+        Async version of search_tech_stack().
+
+        Args:
+            company_name: Name of the company
+            website: Company website (optional)
+
+        Returns:
+            List of technologies/tools (same format as search_tech_stack())
+        """
+        website_str = f" (website: {website})" if website else ""
+        query = f"What technology stack and tools does {company_name}{website_str} use?"
 
-        # Deduplicate
-        technologies = list(dict.fromkeys(technologies))[:8]
+        results = await self.asearch(query, max_results=3, search_depth="basic")
 
-        return technologies if technologies else ["Unknown tech stack"]
+        return _tech_stack_items(results)
 
     def quick_fact_check(self, statement: str) -> Dict[str, Any]:
         """
@@ -298,18 +546,120 @@ class TavilyClient:
         }
 
 
-# Singleton instance
+# Singleton instance (one SDK client and HTTP connection pool per process)
 _tavily_client = None
+_tavily_client_lock = threading.Lock()
 
 
 def get_tavily_client() -> TavilyClient:
     """
     Get singleton Tavily client instance.
 
+    All agents share this instance so they reuse the same underlying HTTP
+    connections. The client is not fork-safe: it is dropped in forked
+    children and lazily re-created on first use there.
+
     Returns:
         TavilyClient instance
     """
     global _tavily_client
     if _tavily_client is None:
-        _tavily_client = TavilyClient()
+        with _tavily_client_lock:
+            if _tavily_client is None:
+                _tavily_client = TavilyClient()
     return _tavily_client
+
+
+# Shared requests session for sync calls to the Tavily REST API
+_tavily_http_session = None
+
+
+def get_tavily_http_session() -> "requests.Session":
+    """
+    Get the shared requests session for sync Tavily requests.
+
+    Its connection pool (HTTP_POOL_SIZE keep-alive connections) is shared by
+    every agent and thread, so searches skip the TCP/TLS handshake once warm.
+    Like the client, it is dropped in forked children.
+
+    Returns:
+        requests.Session
+    """
+    global _tavily_http_session
+    if _tavily_http_session is None:
+        with _tavily_client_lock:
+            if _tavily_http_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+                session.mount("https://", adapter)
+                _tavily_http_session = session
+    return _tavily_http_session
+
+
+# aiohttp sessions for direct (async) calls to the Tavily REST API, one per
+# event loop (a session can't be used outside the loop it was created in)
+_tavily_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = weakref.WeakKeyDictionary()
+_tavily_sessions_lock = threading.Lock()
+
+
+def create_tavily_session() -> "aiohttp.ClientSession":
+    """
+    Create an aiohttp session tuned for Tavily (keep-alive, DNS cache).
+
+    Must be called from a running event loop. The caller owns the session
+    and closes it; get_tavily_session() returns the shared one instead.
+
+    Returns:
+        aiohttp.ClientSession
+    """
+    connector = aiohttp.TCPConnector(
+        limit=50,
+        limit_per_host=20,
+        ttl_dns_cache=300,
+        keepalive_timeout=60
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+async def get_tavily_session() -> "aiohttp.ClientSession":
+    """
+    Get the shared aiohttp session of the running event loop.
+
+    Kept open for the loop's lifetime so calls reuse keep-alive connections
+    (no TLS handshake per prospect) and cached DNS. Each event loop (e.g. the
+    FastAPI loop and a worker thread's asyncio.run) gets its own session.
+    Close it with close_tavily_session() from that loop on shutdown.
+
+    Returns:
+        aiohttp.ClientSession
+    """
+    loop = asyncio.get_running_loop()
+    with _tavily_sessions_lock:
+        session = _tavily_sessions.get(loop)
+        if session is None or session.closed:
+            session = create_tavily_session()
+            _tavily_sessions[loop] = session
+    return session
+
+
+async def close_tavily_session() -> None:
+    """Close the running loop's shared aiohttp session (call on application shutdown)."""
+    loop = asyncio.get_running_loop()
+    with _tavily_sessions_lock:
+        session = _tavily_sessions.pop(loop, None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+def _reset_tavily_client() -> None:
+    """Drop the inherited client in a forked child (sockets can't be shared)."""
+    global _tavily_client, _tavily_client_lock, _tavily_http_session, _tavily_sessions, _tavily_sessions_lock
+    _tavily_client = None
+    _tavily_client_lock = threading.Lock()
+    _tavily_http_session = None
+    _tavily_sessions = weakref.WeakKeyDictionary()
+    _tavily_sessions_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_tavily_client)
@@ -2,7 +2,7 @@
 Schemas pour les requêtes de campagne et résultats globaux.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Dict, Optional
 
 
@@ -31,6 +31,8 @@ class CampaignRequest(BaseModel):
 
 class EmailVariables(BaseModel):
     """Variables générées pour un email"""
+    model_config = ConfigDict(defer_build=True)
+
     # Variables de base
     first_name: Optional[str] = None
     company_name: str
@@ -57,6 +59,8 @@ class EmailVariables(BaseModel):
 
 class EmailResult(BaseModel):
     """Résultat pour un email généré"""
+    model_config = ConfigDict(defer_build=True)
+
     contact: Contact
     email_generated: str = Field(..., description="Email avec toutes les variables remplacées")
     variables: Dict[str, str] = Field(..., description="Toutes les variables générées")
@@ -83,6 +87,8 @@ class EmailResult(BaseModel):
 
 class CampaignResult(BaseModel):
     """Output de l'orchestrateur de campagne"""
+    model_config = ConfigDict(defer_build=True)
+
     batch_id: Optional[str] = None
     emails_generated: List[EmailResult]
 
@@ -0,0 +1,98 @@
+"""
+Optional Hyperscan keyword databases.
+
+Agents compile their keyword tables into one Hyperscan database each, so a
+text is classified in a single linear pass. Without the hyperscan package
+(or if a table fails to compile), compile_keyword_db() returns None and the
+agent keeps its pure-Python scan.
+"""
+
+import logging
+import threading
+from typing import Optional, Sequence, Set
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+logger = logging.getLogger(__name__)
+
+
+class KeywordDatabase:
+    """
+    A compiled Hyperscan database, scanned by match id.
+
+    Expression i matches with id i. Scans are serialized: the database's
+    scratch space is not thread-safe.
+
+    Example:
+        >>> db = compile_keyword_db("pain type", [r"lead|sales", r"recrut"])
+        >>> db.scan("génération de leads")
+        {0}
+    """
+
+    def __init__(self, db):
+        self._db = db
+        self._lock = threading.Lock()
+
+    def scan(self, text: str, stop_on: Optional[int] = None) -> Set[int]:
+        """
+        Return the ids of the expressions matching `text`.
+
+        Args:
+            text: Text to scan (UTF-8 encoded, invalid characters dropped)
+            stop_on: Stop scanning as soon as this id matches
+        """
+        matched_ids = set()
+
+        def on_match(match_id, start, end, flags, context):
+            matched_ids.add(match_id)
+            return match_id == stop_on
+
+        with self._lock:
+            try:
+                self._db.scan(text.encode("utf-8", "ignore"), match_event_handler=on_match)
+            except hyperscan.ScanTerminated:
+                pass
+
+        return matched_ids
+
+
+def compile_keyword_db(
+    name: str,
+    expressions: Sequence[str],
+    caseless: bool = False,
+) -> Optional[KeywordDatabase]:
+    """
+    Compile regex expressions into a single Hyperscan database.
+
+    Each expression reports at most one match per scan.
+
+    Args:
+        name: Database name, for logs
+        expressions: Hyperscan regexes, one per match id
+        caseless: Match case-insensitively (UTF-8 aware)
+
+    Returns:
+        The database, or None if hyperscan is not installed or the
+        expressions do not compile
+    """
+    if hyperscan is None:
+        return None
+
+    flags = hyperscan.HS_FLAG_SINGLEMATCH
+    if caseless:
+        flags |= hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8
+
+    try:
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        db.compile(
+            expressions=[e.encode("utf-8") for e in expressions],
+            ids=list(range(len(expressions))),
+            flags=[flags] * len(expressions),
+        )
+    except Exception as e:
+        logger.warning("Could not compile Hyperscan %s database: %s", name, e)
+        return None
+    return KeywordDatabase(db)
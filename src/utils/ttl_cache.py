@@ -0,0 +1,85 @@
+"""
+In-memory TTL cache for web search results.
+
+The same company shows up across pipeline runs (retries, multi-campaign
+targeting): agents keep recent Tavily results here instead of paying a
+network round-trip per prospect. Thread-safe, bounded, per process.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    Bounded cache whose entries expire `ttl` seconds after being stored.
+
+    When full, the oldest entry is evicted. Hit/miss counters are kept for
+    observability (see stats()).
+
+    Example:
+        >>> cache = TTLCache(maxsize=1000, ttl=3600)
+        >>> cache.set(("aircall", 3), news)
+        >>> cache.get(("aircall", 3))
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Args:
+            maxsize: Maximum number of entries
+            ttl: Time to live of an entry, in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[Hashable, Tuple[float, V]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the value stored for `key`, or None if missing or expired."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and now - entry[0] < self.ttl:
+                self._hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._data[key]
+            self._misses += 1
+            return None
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store `value` for `key` (evicting the oldest entry if full)."""
+        with self._lock:
+            if key in self._data:
+                del self._data[key]  # Re-inserted below: now the newest entry
+            elif len(self._data) >= self.maxsize:
+                # Dicts keep insertion order: the first entry is the oldest
+                del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic(), value)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters: hits, misses, size and hit_rate (0-1)."""
+        with self._lock:
+            hits, misses, size = self._hits, self._misses, len(self._data)
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "size": size,
+            "hit_rate": hits / total if total else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)